@@ -7,16 +7,65 @@
 
 #include "mesh_io.h"
 #include <fstream>
-#include <sstream>
 #include <iostream>
 #include <algorithm>
 #include <cctype>
+#include <cerrno>
+#include <climits>
 #include <cstdint>
+#include <cstdlib>
+#include <cstring>
+#include <stdexcept>
+#include <string>
 
 namespace meshio {
 
 // Constants
-constexpr size_t LINE_BUFFER_SIZE = 256;  // Typical OBJ line length
+constexpr size_t FACE_VERTICES_RESERVE = 8;  // Typical upper bound on polygon size
+
+// ============================================================================
+// Internal helpers
+// ============================================================================
+
+// Whitespace within a line (the '\n' terminator is handled by the line splitter)
+static inline bool is_space(char c) {
+    return c == ' ' || c == '\t' || c == '\r' || c == '\v' || c == '\f';
+}
+
+static inline const char* skip_space(const char* p, const char* end) {
+    while (p < end && is_space(*p)) ++p;
+    return p;
+}
+
+// Parse one float token starting at p; returns false if no number starts before end.
+// The buffer is NUL-terminated, so strtof always stops by the end of the line.
+static inline bool parse_float(const char*& p, const char* end, float& value) {
+    p = skip_space(p, end);
+    if (p == end) return false;
+    char* num_end;
+    value = std::strtof(p, &num_end);
+    if (num_end == p || num_end > end) return false;
+    p = num_end;
+    return true;
+}
+
+// Parse the vertex index of a face token (v, v/vt, v/vt/vn, or v//vn)
+static int32_t parse_face_index(const char* token, const char* token_end, const char* line, const char* line_end) {
+    errno = 0;
+    char* num_end;
+    long v_idx = std::strtol(token, &num_end, 10);
+    if (num_end == token || num_end > token_end) {
+        throw std::invalid_argument("Invalid vertex index in OBJ face: " + std::string(line, line_end));
+    }
+    if (errno == ERANGE || v_idx < INT32_MIN || v_idx > INT32_MAX) {
+        throw std::out_of_range("Vertex index out of range in OBJ face: " + std::string(line, line_end));
+    }
+    return static_cast<int32_t>(v_idx);
+}
+
+// ============================================================================
+// Public API
+// ============================================================================
 
 bool load_obj(const char* filename,
               std::vector<Vec3f>& vertList,
@@ -25,7 +74,7 @@ bool load_obj(const char* filename,
               Vec3f& max_box) {
 
     // RAII: ifstream automatically closes file on scope exit
-    std::ifstream infile(filename);
+    std::ifstream infile(filename, std::ios::binary);
     if (!infile) {
         std::cerr << "ERROR: Failed to open OBJ file: " << filename << std::endl;
         return false;
@@ -33,6 +82,19 @@ bool load_obj(const char* filename,
 
     std::cout << "Reading OBJ file: " << filename << std::endl;
 
+    // Read the whole file with one bulk read and parse it in place; this avoids a
+    // std::string/istringstream per line, which dominated load time on large meshes
+    infile.seekg(0, std::ios::end);
+    const std::streamoff file_size = infile.tellg();
+    infile.seekg(0, std::ios::beg);
+
+    std::string buffer(static_cast<size_t>(file_size), '\0');
+    infile.read(&buffer[0], static_cast<std::streamsize>(file_size));
+    if (infile.fail()) {
+        std::cerr << "ERROR: Failed to read OBJ file: " << filename << std::endl;
+        return false;
+    }
+
     // Clear output containers
     vertList.clear();
     faceList.clear();
@@ -46,36 +108,48 @@ bool load_obj(const char* filename,
                     std::numeric_limits<float>::lowest());
 
     int32_t ignored_lines = 0;
-    std::string line;
-    line.reserve(LINE_BUFFER_SIZE);
+    std::vector<int32_t> vertices;  // Face vertex indices, reused across lines
+    vertices.reserve(FACE_VERTICES_RESERVE);
+
+    const char* cursor = buffer.c_str();
+    const char* buffer_end = cursor + buffer.size();
+
+    while (cursor < buffer_end) {
+        // Split off the next line (without its '\n')
+        const char* line = cursor;
+        const char* line_end = static_cast<const char*>(std::memchr(line, '\n', buffer_end - line));
+        if (line_end == nullptr) line_end = buffer_end;
+        cursor = line_end + 1;
+
+        const size_t line_size = static_cast<size_t>(line_end - line);
 
-    while (std::getline(infile, line)) {
         // Skip empty lines
-        if (line.empty()) {
+        if (line_size == 0) {
             continue;
         }
 
+        const char second = line_size >= 2 ? line[1] : '\0';
+
         // Parse line based on first character(s)
         if (line[0] == 'v') {
-            if (line.size() >= 2 && line[1] == 'n') {
+            if (second == 'n') {
                 // Vertex normal - skip (not needed for SDF generation)
                 ++ignored_lines;
                 continue;
             }
-            else if (line.size() >= 2 && line[1] == 't') {
+            else if (second == 't') {
                 // Texture coordinate - skip
                 ++ignored_lines;
                 continue;
             }
-            else if (line[1] == ' ' || line[1] == '\t') {
+            else if (second == ' ' || second == '\t') {
                 // Vertex position
-                std::istringstream data(line);
-                char c;
+                const char* p = line + 1;
                 Vec3f point;
-                data >> c >> point[0] >> point[1] >> point[2];
-
-                if (data.fail()) {
-                    std::cerr << "WARNING: Failed to parse vertex: " << line << std::endl;
+                if (!parse_float(p, line_end, point[0]) ||
+                    !parse_float(p, line_end, point[1]) ||
+                    !parse_float(p, line_end, point[2])) {
+                    std::cerr << "WARNING: Failed to parse vertex: " << std::string(line, line_end) << std::endl;
                     continue;
                 }
 
@@ -83,30 +157,29 @@ bool load_obj(const char* filename,
                 update_minmax(point, min_box, max_box);
             }
         }
-        else if (line[0] == 'f' && (line[1] == ' ' || line[1] == '\t')) {
+        else if (line[0] == 'f' && (second == ' ' || second == '\t')) {
             // Face - can be v, v/vt, v/vt/vn, or v//vn format
             // Can be triangles or quads
-            std::istringstream data(line);
-            char c;
-            data >> c; // Skip 'f'
-
-            std::vector<int32_t> vertices;
-            std::string vertex_str;
-
-            // Read all vertex entries
-            while (data >> vertex_str) {
-                // Parse v/vt/vn format - extract only vertex index
-                size_t first_slash = vertex_str.find('/');
-                std::string v_str = (first_slash != std::string::npos)
-                                   ? vertex_str.substr(0, first_slash)
-                                   : vertex_str;
-
-                int32_t v_idx = std::stoi(v_str);
-                vertices.push_back(v_idx);
+            vertices.clear();
+
+            // Read all vertex entries (whitespace-separated tokens after 'f')
+            const char* p = line + 1;
+            while (true) {
+                p = skip_space(p, line_end);
+                if (p == line_end) break;
+
+                const char* token_end = p;
+                while (token_end < line_end && !is_space(*token_end)) ++token_end;
+
+                // Extract only the vertex index (text before the first '/')
+                const char* slash = static_cast<const char*>(std::memchr(p, '/', token_end - p));
+                vertices.push_back(parse_face_index(p, slash ? slash : token_end, line, line_end));
+
+                p = token_end;
             }
 
             if (vertices.size() < 3) {
-                std::cerr << "WARNING: Face has < 3 vertices: " << line << std::endl;
+                std::cerr << "WARNING: Face has < 3 vertices: " << std::string(line, line_end) << std::endl;
                 continue;
             }
 
@@ -130,8 +203,6 @@ bool load_obj(const char* filename,
         }
     }
 
-    // RAII: infile automatically closed here
-
     // Validate results
     if (vertList.empty()) {
         std::cerr << "ERROR: No vertices found in OBJ file" << std::endl;
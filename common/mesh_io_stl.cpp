@@ -28,6 +28,9 @@ constexpr size_t LINE_BUFFER_SIZE = 256;            // Typical ASCII STL line le
 constexpr int32_t VERTICES_PER_TRIANGLE = 3;        // Number of vertices in a triangle
 constexpr size_t MIN_HEADER_BYTES_TO_READ = 5;      // Minimum bytes needed to detect "solid"
 
+static_assert(STL_TRIANGLE_SIZE == STL_NORMAL_SIZE + STL_VERTEX_DATA_SIZE + STL_ATTRIBUTE_SIZE,
+              "Binary STL triangle record layout mismatch");
+
 // ============================================================================
 // Internal helpers
 // ============================================================================
@@ -122,11 +125,35 @@ static bool load_binary_stl(const char* filename,
 
     std::cout << "Reading binary STL with " << num_triangles << " triangles..." << std::endl;
 
-    // Clear and reserve space
+    // Validate the triangle count against the file size before allocating, so a
+    // corrupt header cannot trigger a huge allocation
+    const std::streamoff data_start = file.tellg();
+    file.seekg(0, std::ios::end);
+    const std::streamoff data_bytes = file.tellg() - data_start;
+    file.seekg(data_start, std::ios::beg);
+
+    const uint64_t records_bytes = static_cast<uint64_t>(num_triangles) * STL_TRIANGLE_SIZE;
+    if (static_cast<uint64_t>(data_bytes) < records_bytes) {
+        std::cerr << "ERROR: Failed to read triangle "
+                  << static_cast<uint64_t>(data_bytes) / STL_TRIANGLE_SIZE << std::endl;
+        return false;
+    }
+
+    // Read every triangle record with one bulk read instead of a read and two
+    // seeks per triangle, then decode from memory
+    std::vector<char> records(static_cast<size_t>(records_bytes));
+    file.read(records.data(), static_cast<std::streamsize>(records_bytes));
+
+    if (file.fail()) {
+        std::cerr << "ERROR: Failed to read triangle data from binary STL" << std::endl;
+        return false;
+    }
+
+    // Clear and size outputs (every triangle contributes 3 unshared vertices)
     vertList.clear();
     faceList.clear();
-    vertList.reserve(num_triangles * 3);
-    faceList.reserve(num_triangles);
+    vertList.resize(static_cast<size_t>(num_triangles) * VERTICES_PER_TRIANGLE);
+    faceList.resize(num_triangles);
 
     // Initialize bounding box
     min_box = Vec3f(std::numeric_limits<float>::max(),
@@ -136,33 +163,22 @@ static bool load_binary_stl(const char* filename,
                     std::numeric_limits<float>::lowest(),
                     std::numeric_limits<float>::lowest());
 
-    // Read triangles
-    for (uint32_t i = 0; i < num_triangles; ++i) {
-        // Skip normal (STL_NORMAL_SIZE bytes = 3 floats)
-        file.seekg(STL_NORMAL_SIZE, std::ios::cur);
-
-        // Read 3 vertices (9 floats = STL_VERTEX_DATA_SIZE bytes)
+    // Decode triangles: skip the normal, copy 9 floats, ignore attribute bytes
+    const char* record = records.data();
+    for (uint32_t i = 0; i < num_triangles; ++i, record += STL_TRIANGLE_SIZE) {
         float v[9];
-        file.read(reinterpret_cast<char*>(v), STL_VERTEX_DATA_SIZE);
-
-        if (file.fail()) {
-            std::cerr << "ERROR: Failed to read triangle " << i << std::endl;
-            return false;
-        }
-
-        // Skip attribute bytes (STL_ATTRIBUTE_SIZE bytes)
-        file.seekg(STL_ATTRIBUTE_SIZE, std::ios::cur);
+        std::memcpy(v, record + STL_NORMAL_SIZE, STL_VERTEX_DATA_SIZE);
 
         // Store vertices and update bounds
-        uint32_t idx_base = static_cast<uint32_t>(vertList.size());
+        uint32_t idx_base = i * VERTICES_PER_TRIANGLE;
         for (int32_t j = 0; j < VERTICES_PER_TRIANGLE; ++j) {
             Vec3f vertex(v[j*VERTICES_PER_TRIANGLE], v[j*VERTICES_PER_TRIANGLE+1], v[j*VERTICES_PER_TRIANGLE+2]);
-            vertList.push_back(vertex);
+            vertList[idx_base + j] = vertex;
             update_minmax(vertex, min_box, max_box);
         }
 
         // Add face (3 sequential vertices)
-        faceList.push_back(Vec3ui(idx_base, idx_base + 1, idx_base + 2));
+        faceList[i] = Vec3ui(idx_base, idx_base + 1, idx_base + 2);
     }
 
     std::cout << "  Loaded " << vertList.size() << " vertices and "
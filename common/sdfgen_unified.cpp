@@ -11,51 +11,110 @@
 #include <cuda_runtime.h>
 #endif
 
+#include <exception>
 #include <iostream>
 #include <stdexcept>
+#include <thread>
 
 namespace sdfgen {
 
 bool is_gpu_available() {
 #ifdef HAVE_CUDA
-    // Check at runtime if a CUDA-capable GPU is actually present
-    int device_count = 0;
-    cudaError_t error = cudaGetDeviceCount(&device_count);
-    return (error == cudaSuccess && device_count > 0);
+    // Check at runtime if a CUDA-capable GPU is actually present. The first call
+    // initialises the CUDA runtime, so probe once and reuse the answer (thread-safe
+    // static initialisation)
+    static const bool available = [] {
+        int device_count = 0;
+        cudaError_t error = cudaGetDeviceCount(&device_count);
+        return (error == cudaSuccess && device_count > 0);
+    }();
+    return available;
 #else
     return false;
 #endif
 }
 
+void cuda_synchronize() {
+#ifdef HAVE_CUDA
+    if (is_gpu_available()) {
+        cudaDeviceSynchronize();
+    }
+#endif
+}
+
+void clear_device_cache() {
+#ifdef HAVE_CUDA
+    gpu::clear_device_cache();
+#endif
+}
+
+void set_num_threads(int num_threads) {
+    cpu::set_num_threads(num_threads);
+}
+
+int get_num_threads() {
+    return cpu::get_num_threads();
+}
+
 void make_level_set3(
-    const std::vector<Vec3ui>& tri,
-    const std::vector<Vec3f>& x,
+    const Vec3ui* tri, size_t num_triangles,
+    const Vec3f* x, size_t num_vertices,
     const Vec3f& origin,
     float dx,
     int nx, int ny, int nz,
     Array3f& phi,
     int exact_band,
     HardwareBackend backend,
-    int num_threads)
+    int num_threads,
+    bool accumulate_double)
 {
-    // Handle Auto mode: try GPU first (if available at runtime), fall back to CPU
+    // Handle Auto mode: try GPU first (if available at runtime), fall back to CPU.
+    // Double-precision accumulation is CPU-only, so it always resolves to CPU
     if (backend == HardwareBackend::Auto) {
-        if (is_gpu_available()) {
+        if (!accumulate_double && is_gpu_available()) {
             backend = HardwareBackend::GPU;
         } else {
             backend = HardwareBackend::CPU;
         }
     }
 
+    if (accumulate_double &&
+        (backend == HardwareBackend::GPU || backend == HardwareBackend::GPU_JFA)) {
+        throw std::invalid_argument(
+            "Double-precision accumulation is only supported by the CPU backends"
+        );
+    }
+
     // Dispatch to appropriate implementation
     switch (backend) {
         case HardwareBackend::CPU:
-            cpu::make_level_set3(tri, x, origin, dx, nx, ny, nz, phi, exact_band, num_threads);
+            cpu::make_level_set3(tri, num_triangles, x, num_vertices,
+                                 origin, dx, nx, ny, nz, phi, exact_band, num_threads,
+                                 accumulate_double);
+            break;
+
+        case HardwareBackend::CPU_NARROWBAND:
+            cpu::make_level_set3_narrowband(tri, num_triangles, x, num_vertices,
+                                            origin, dx, nx, ny, nz, phi, exact_band,
+                                            num_threads, accumulate_double);
             break;
 
         case HardwareBackend::GPU:
 #ifdef HAVE_CUDA
-            gpu::make_level_set3(tri, x, origin, dx, nx, ny, nz, phi, exact_band);
+            gpu::make_level_set3(tri, num_triangles, x, num_vertices,
+                                 origin, dx, nx, ny, nz, phi, exact_band);
+#else
+            throw std::runtime_error(
+                "GPU backend requested but CUDA support is not available. "
+                "Rebuild with CUDA enabled or use HardwareBackend::CPU."
+            );
+#endif
+            break;
+
+        case HardwareBackend::GPU_JFA:
+#ifdef HAVE_CUDA
+            gpu::make_level_set3_jfa(tri, num_triangles, x, num_vertices,
+                                     origin, dx, nx, ny, nz, phi, exact_band);
 #else
             throw std::runtime_error(
                 "GPU backend requested but CUDA support is not available. "
@@ -70,4 +129,159 @@ void make_level_set3(
     }
 }
 
+void make_level_set3(
+    const std::vector<Vec3ui>& tri,
+    const std::vector<Vec3f>& x,
+    const Vec3f& origin,
+    float dx,
+    int nx, int ny, int nz,
+    Array3f& phi,
+    int exact_band,
+    HardwareBackend backend,
+    int num_threads,
+    bool accumulate_double)
+{
+    make_level_set3(tri.data(), tri.size(), x.data(), x.size(),
+                    origin, dx, nx, ny, nz, phi, exact_band, backend, num_threads,
+                    accumulate_double);
+}
+
+void make_level_set3_multires(
+    const Vec3ui* tri, size_t num_triangles,
+    const Vec3f* x, size_t num_vertices,
+    const Vec3f& origin,
+    float extent,
+    const std::vector<int>& resolutions,
+    std::vector<Array3f>& phis,
+    int exact_band,
+    HardwareBackend backend,
+    int num_threads)
+{
+    // Each level is a cubic grid over the same region
+    std::vector<GridSpec> grids;
+    grids.reserve(resolutions.size());
+    for (int n : resolutions) {
+        grids.push_back(GridSpec{origin, extent / n, n, n, n});
+    }
+    make_level_set3_batch(tri, num_triangles, x, num_vertices, grids, phis,
+                          exact_band, backend, num_threads);
+}
+
+void make_level_set3_multires(
+    const std::vector<Vec3ui>& tri,
+    const std::vector<Vec3f>& x,
+    const Vec3f& origin,
+    float extent,
+    const std::vector<int>& resolutions,
+    std::vector<Array3f>& phis,
+    int exact_band,
+    HardwareBackend backend,
+    int num_threads)
+{
+    make_level_set3_multires(tri.data(), tri.size(), x.data(), x.size(), origin, extent,
+                             resolutions, phis, exact_band, backend, num_threads);
+}
+
+void make_level_set3_batch(
+    const Vec3ui* tri, size_t num_triangles,
+    const Vec3f* x, size_t num_vertices,
+    const std::vector<GridSpec>& grids,
+    std::vector<Array3f>& phis,
+    int exact_band,
+    HardwareBackend backend,
+    int num_threads)
+{
+    // Resolve Auto once so the GPU probe isn't repeated for every grid
+    if (backend == HardwareBackend::Auto) {
+        backend = is_gpu_available() ? HardwareBackend::GPU : HardwareBackend::CPU;
+    }
+
+    phis.resize(grids.size());
+    for (size_t i = 0; i < grids.size(); ++i) {
+        const GridSpec& g = grids[i];
+        make_level_set3(tri, num_triangles, x, num_vertices, g.origin, g.dx, g.nx, g.ny, g.nz,
+                        phis[i], exact_band, backend, num_threads);
+    }
+}
+
+void make_level_set3_batch(
+    const std::vector<Vec3ui>& tri,
+    const std::vector<Vec3f>& x,
+    const std::vector<GridSpec>& grids,
+    std::vector<Array3f>& phis,
+    int exact_band,
+    HardwareBackend backend,
+    int num_threads)
+{
+    make_level_set3_batch(tri.data(), tri.size(), x.data(), x.size(), grids, phis,
+                          exact_band, backend, num_threads);
+}
+
+void make_level_set3_both(
+    const Vec3ui* tri, size_t num_triangles,
+    const Vec3f* x, size_t num_vertices,
+    const Vec3f& origin,
+    float dx,
+    int nx, int ny, int nz,
+    Array3f& phi_cpu,
+    Array3f& phi_gpu,
+    int exact_band,
+    int num_threads)
+{
+#ifdef HAVE_CUDA
+    if (!is_gpu_available()) {
+        throw std::runtime_error(
+            "Concurrent CPU/GPU generation requires a CUDA-capable GPU, but none was found."
+        );
+    }
+
+    // GPU upload and kernels run on a worker thread; the mesh vectors are only read,
+    // so both backends can share them without copies
+    std::exception_ptr gpu_error;
+    std::thread gpu_worker([&]() {
+        try {
+            gpu::make_level_set3(tri, num_triangles, x, num_vertices,
+                                 origin, dx, nx, ny, nz, phi_gpu, exact_band);
+        } catch (...) {
+            gpu_error = std::current_exception();
+        }
+    });
+
+    std::exception_ptr cpu_error;
+    try {
+        cpu::make_level_set3(tri, num_triangles, x, num_vertices,
+                             origin, dx, nx, ny, nz, phi_cpu, exact_band, num_threads);
+    } catch (...) {
+        cpu_error = std::current_exception();
+    }
+
+    gpu_worker.join();
+
+    if (cpu_error) std::rethrow_exception(cpu_error);
+    if (gpu_error) std::rethrow_exception(gpu_error);
+#else
+    (void)tri; (void)num_triangles; (void)x; (void)num_vertices; (void)origin; (void)dx; (void)nx; (void)ny; (void)nz;
+    (void)phi_cpu; (void)phi_gpu; (void)exact_band; (void)num_threads;
+    throw std::runtime_error(
+        "Concurrent CPU/GPU generation requires CUDA support, which is not available. "
+        "Rebuild with CUDA enabled."
+    );
+#endif
+}
+
+void make_level_set3_both(
+    const std::vector<Vec3ui>& tri,
+    const std::vector<Vec3f>& x,
+    const Vec3f& origin,
+    float dx,
+    int nx, int ny, int nz,
+    Array3f& phi_cpu,
+    Array3f& phi_gpu,
+    int exact_band,
+    int num_threads)
+{
+    make_level_set3_both(tri.data(), tri.size(), x.data(), x.size(),
+                         origin, dx, nx, ny, nz, phi_cpu, phi_gpu, exact_band, num_threads);
+}
+
 } // namespace sdfgen
@@ -6,6 +6,7 @@
 
 #include "array3.h"
 #include "vec.h"
+#include <cstddef>
 #include <vector>
 
 namespace sdfgen {
@@ -16,7 +17,9 @@ namespace sdfgen {
 enum class HardwareBackend {
     Auto,  /**< Try GPU first, fall back to CPU if unavailable */
     CPU,   /**< Force CPU implementation */
-    GPU    /**< Force GPU implementation (fails if CUDA not available) */
+    CPU_NARROWBAND, /**< CPU, exact distances within exact_band cells only; |phi| clamped to exact_band*dx */
+    GPU,   /**< Force GPU implementation (fails if CUDA not available) */
+    GPU_JFA /**< GPU implementation with jump-flooding far-field propagation (fails if CUDA not available) */
 };
 
 /**
@@ -38,8 +41,13 @@ enum class HardwareBackend {
  * @param nz Grid dimension in Z (number of cells)
  * @param phi Output SDF grid (will be resized to nx*ny*nz)
  * @param exact_band Distance band in cells for exact computation (default: 1)
- * @param backend Hardware selection: Auto, CPU, or GPU (default: Auto)
+ * @param backend Hardware selection: Auto, CPU, CPU_NARROWBAND, GPU, or GPU_JFA (default: Auto)
  * @param num_threads CPU thread count, 0 = auto-detect (only used for CPU backend)
+ * @param accumulate_double Compute grid positions and distances in double precision while
+ *        still storing phi as float; improves accuracy for meshes far from the origin.
+ *        CPU backends only: Auto then resolves to CPU (default: false)
+ *
+ * @throws std::invalid_argument if accumulate_double is set with a GPU backend
  *
  * @note When backend is Auto, GPU is tried first and falls back to CPU if unavailable
  * @note The exact_band parameter controls accuracy vs performance tradeoff
@@ -53,6 +61,174 @@ void make_level_set3(
     Array3f& phi,
     int exact_band = 1,
     HardwareBackend backend = HardwareBackend::Auto,
+    int num_threads = 0,
+    bool accumulate_double = false
+);
+
+/**
+ * @brief Generate a signed distance field from caller-owned mesh arrays
+ *
+ * Same as the std::vector overload above, but reads the mesh in place from contiguous
+ * arrays (e.g. NumPy buffers), so bindings can pass their input without a copy. The arrays
+ * must remain valid and unmodified until the call returns.
+ *
+ * @param tri Pointer to num_triangles triangle index triples
+ * @param num_triangles Number of triangles
+ * @param x Pointer to num_vertices vertex positions
+ * @param num_vertices Number of vertices
+ */
+void make_level_set3(
+    const Vec3ui* tri, size_t num_triangles,
+    const Vec3f* x, size_t num_vertices,
+    const Vec3f& origin,
+    float dx,
+    int nx, int ny, int nz,
+    Array3f& phi,
+    int exact_band = 1,
+    HardwareBackend backend = HardwareBackend::Auto,
+    int num_threads = 0,
+    bool accumulate_double = false
+);
+
+/**
+ * @brief Generate signed distance fields of one mesh at several grid resolutions
+ *
+ * Computes one cubic SDF grid per entry in resolutions, all covering the same world-space
+ * region [origin, origin + extent]^3. Level l uses resolutions[l] cells per axis with
+ * dx = extent / resolutions[l]. The mesh is shared by every level and the hardware backend
+ * is resolved once up front, so per-level overhead is limited to the grid computation itself.
+ *
+ * @param tri Triangle indices (mesh topology), each Vec3ui contains 3 vertex indices
+ * @param x Vertex positions (mesh geometry) in world coordinates
+ * @param origin Grid origin point in world space (corner of every grid)
+ * @param extent Edge length of the cubic region covered by every grid
+ * @param resolutions Number of cells per axis for each level (all must be positive)
+ * @param phis Output SDF grids, one per resolution (resized to resolutions.size())
+ * @param exact_band Distance band in cells for exact computation (default: 1)
+ * @param backend Hardware selection: Auto, CPU, or GPU (default: Auto)
+ * @param num_threads CPU thread count, 0 = auto-detect (only used for CPU backend)
+ */
+void make_level_set3_multires(
+    const std::vector<Vec3ui>& tri,
+    const std::vector<Vec3f>& x,
+    const Vec3f& origin,
+    float extent,
+    const std::vector<int>& resolutions,
+    std::vector<Array3f>& phis,
+    int exact_band = 1,
+    HardwareBackend backend = HardwareBackend::Auto,
+    int num_threads = 0
+);
+
+/**
+ * @brief Multi-resolution generation from caller-owned mesh arrays (no copy)
+ */
+void make_level_set3_multires(
+    const Vec3ui* tri, size_t num_triangles,
+    const Vec3f* x, size_t num_vertices,
+    const Vec3f& origin,
+    float extent,
+    const std::vector<int>& resolutions,
+    std::vector<Array3f>& phis,
+    int exact_band = 1,
+    HardwareBackend backend = HardwareBackend::Auto,
+    int num_threads = 0
+);
+
+/**
+ * @brief Placement and resolution of one SDF grid
+ */
+struct GridSpec {
+    Vec3f origin;   /**< Grid origin point in world space (corner of grid) */
+    float dx;       /**< Grid cell spacing (uniform in all dimensions) */
+    int nx, ny, nz; /**< Grid dimensions (number of cells) */
+};
+
+/**
+ * @brief Generate signed distance fields of one mesh on several independent grids
+ *
+ * Like calling make_level_set3() once per entry in grids, but the hardware backend is
+ * resolved once up front and every grid reads the same mesh, so a batch of small grids
+ * does not pay per-call setup for each of them. Unlike make_level_set3_multires(), the
+ * grids may have arbitrary origins, spacings and (non-cubic) dimensions.
+ *
+ * @param tri Triangle indices (mesh topology), each Vec3ui contains 3 vertex indices
+ * @param x Vertex positions (mesh geometry) in world coordinates
+ * @param grids Grid placement and dimensions, one entry per output SDF
+ * @param phis Output SDF grids, one per entry in grids (resized to grids.size())
+ * @param exact_band Distance band in cells for exact computation (default: 1)
+ * @param backend Hardware selection: Auto, CPU, CPU_NARROWBAND, GPU, or GPU_JFA (default: Auto)
+ * @param num_threads CPU thread count, 0 = auto-detect (only used for CPU backend)
+ */
+void make_level_set3_batch(
+    const std::vector<Vec3ui>& tri,
+    const std::vector<Vec3f>& x,
+    const std::vector<GridSpec>& grids,
+    std::vector<Array3f>& phis,
+    int exact_band = 1,
+    HardwareBackend backend = HardwareBackend::Auto,
+    int num_threads = 0
+);
+
+/**
+ * @brief Batched generation from caller-owned mesh arrays (no copy)
+ */
+void make_level_set3_batch(
+    const Vec3ui* tri, size_t num_triangles,
+    const Vec3f* x, size_t num_vertices,
+    const std::vector<GridSpec>& grids,
+    std::vector<Array3f>& phis,
+    int exact_band = 1,
+    HardwareBackend backend = HardwareBackend::Auto,
+    int num_threads = 0
+);
+
+/**
+ * @brief Generate the same signed distance field on the CPU and GPU concurrently
+ *
+ * Runs the GPU implementation on a worker thread while the CPU implementation runs on
+ * the calling thread, both reading the same host-side mesh buffers. Wall-clock time is
+ * roughly max(cpu_time, gpu_time) instead of their sum, which makes it suitable for
+ * validating one backend against the other.
+ *
+ * @param tri Triangle indices (mesh topology), each Vec3ui contains 3 vertex indices
+ * @param x Vertex positions (mesh geometry) in world coordinates
+ * @param origin Grid origin point in world space (corner of grid)
+ * @param dx Grid cell spacing (uniform in all dimensions)
+ * @param nx Grid dimension in X (number of cells)
+ * @param ny Grid dimension in Y (number of cells)
+ * @param nz Grid dimension in Z (number of cells)
+ * @param phi_cpu Output SDF grid computed by the CPU backend
+ * @param phi_gpu Output SDF grid computed by the GPU backend
+ * @param exact_band Distance band in cells for exact computation (default: 1)
+ * @param num_threads CPU thread count, 0 = auto-detect
+ *
+ * @throws std::runtime_error if no CUDA GPU is available
+ */
+void make_level_set3_both(
+    const std::vector<Vec3ui>& tri,
+    const std::vector<Vec3f>& x,
+    const Vec3f& origin,
+    float dx,
+    int nx, int ny, int nz,
+    Array3f& phi_cpu,
+    Array3f& phi_gpu,
+    int exact_band = 1,
+    int num_threads = 0
+);
+
+/**
+ * @brief Concurrent CPU/GPU generation from caller-owned mesh arrays (no copy)
+ */
+void make_level_set3_both(
+    const Vec3ui* tri, size_t num_triangles,
+    const Vec3f* x, size_t num_vertices,
+    const Vec3f& origin,
+    float dx,
+    int nx, int ny, int nz,
+    Array3f& phi_cpu,
+    Array3f& phi_gpu,
+    int exact_band = 1,
     int num_threads = 0
 );
 
@@ -61,10 +237,46 @@ void make_level_set3(
  *
  * Checks if the library was compiled with CUDA support and if a compatible CUDA GPU
  * is present and accessible on the system. This can be used to determine if the GPU
- * backend option will succeed.
+ * backend option will succeed. The device is probed on the first call only; later calls
+ * return the cached result.
  *
  * @return true if CUDA GPU is available and functional, false otherwise
  */
 bool is_gpu_available();
 
+/**
+ * @brief Block until all outstanding GPU work has completed
+ *
+ * Wraps cudaDeviceSynchronize() so host-side timers can be stopped only after kernels
+ * have actually finished. This is a no-op when the library was built without CUDA or
+ * no GPU is present.
+ */
+void cuda_synchronize();
+
+/**
+ * @brief Free meshes cached on the GPU between calls
+ *
+ * The GPU backend keeps recently used meshes resident on the device (LRU, capped at
+ * 256 MB, keyed by mesh contents) so repeated SDFs of the same mesh skip the upload.
+ * Call this to return that memory to the device. No-op without CUDA.
+ */
+void clear_device_cache();
+
+/**
+ * @brief Set the default CPU thread count
+ *
+ * Used by every CPU computation that is called with num_threads = 0. The CPU backend
+ * runs on a persistent worker pool shared across calls; this also starts its workers
+ * so the first call does not pay for thread creation.
+ *
+ * @param num_threads Thread count, 0 = auto-detect (hardware concurrency)
+ * @throws std::invalid_argument if num_threads is negative
+ */
+void set_num_threads(int num_threads);
+
+/**
+ * @brief Get the CPU thread count used for calls with num_threads = 0
+ */
+int get_num_threads();
+
 } // namespace sdfgen
@@ -3,8 +3,12 @@
 // Licensed under the MIT License - see LICENSE file
 
 #include "makelevelset3.h"
+#include "thread_pool.h"
+#include <atomic>
 #include <iostream>
+#include <stdexcept>
 #include <thread>
+#include <utility>
 #include <vector>
 
 /**
@@ -17,13 +21,16 @@
  * @param x1 First endpoint of line segment
  * @param x2 Second endpoint of line segment
  * @return Minimum Euclidean distance from x0 to segment
+ *
+ * Real is the working precision (float, or double for accumulate_double)
  */
-static float point_segment_distance(const Vec3f &x0, const Vec3f &x1, const Vec3f &x2)
+template<class Real>
+static Real point_segment_distance(const Vec<3,Real> &x0, const Vec<3,Real> &x1, const Vec<3,Real> &x2)
 {
-   Vec3f dx(x2-x1);
+   Vec<3,Real> dx(x2-x1);
    double m2=mag2(dx);
    // find parameter value of closest point on segment
-   float s12=(float)(dot(x2-x0, dx)/m2);
+   Real s12=(Real)(dot(x2-x0, dx)/m2);
    if(s12<0){
       s12=0;
    }else if(s12>1){
@@ -46,17 +53,18 @@ static float point_segment_distance(const Vec3f &x0, const Vec3f &x1, const Vec3
  * @param x3 Third vertex of triangle
  * @return Minimum Euclidean distance from x0 to triangle
  */
-static float point_triangle_distance(const Vec3f &x0, const Vec3f &x1, const Vec3f &x2, const Vec3f &x3)
+template<class Real>
+static Real point_triangle_distance(const Vec<3,Real> &x0, const Vec<3,Real> &x1, const Vec<3,Real> &x2, const Vec<3,Real> &x3)
 {
    // first find barycentric coordinates of closest point on infinite plane
-   Vec3f x13(x1-x3), x23(x2-x3), x03(x0-x3);
-   float m13=mag2(x13), m23=mag2(x23), d=dot(x13,x23);
-   float invdet=1.f/max(m13*m23-d*d,1e-30f);
-   float a=dot(x13,x03), b=dot(x23,x03);
+   Vec<3,Real> x13(x1-x3), x23(x2-x3), x03(x0-x3);
+   Real m13=mag2(x13), m23=mag2(x23), d=dot(x13,x23);
+   Real invdet=Real(1)/max(m13*m23-d*d,Real(1e-30));
+   Real a=dot(x13,x03), b=dot(x23,x03);
    // the barycentric coordinates themselves
-   float w23=invdet*(m23*a-d*b);
-   float w31=invdet*(m13*b-d*a);
-   float w12=1-w23-w31;
+   Real w23=invdet*(m23*a-d*b);
+   Real w31=invdet*(m13*b-d*a);
+   Real w12=1-w23-w31;
    if(w23>=0 && w31>=0 && w12>=0){ // if we're inside the triangle
       return dist(x0, w23*x1+w31*x2+w12*x3); 
    }else{ // we have to clamp to one of the edges
@@ -87,21 +95,22 @@ static float point_triangle_distance(const Vec3f &x0, const Vec3f &x1, const Vec
  * @param j1 Neighbor cell j-index
  * @param k1 Neighbor cell k-index
  */
-static void check_neighbour(const std::vector<Vec3ui> &tri, const std::vector<Vec3f> &x,
+template<class Real>
+static void check_neighbour(const Vec3ui *tri, const Vec3f *x,
                             Array3f &phi, Array3i &closest_tri,
-                            const Vec3f &gx, int i0, int j0, int k0, int i1, int j1, int k1)
+                            const Vec<3,Real> &gx, int i0, int j0, int k0, int i1, int j1, int k1)
 {
    if(closest_tri(i1,j1,k1)>=0){
       unsigned int p, q, r; assign(tri[closest_tri(i1,j1,k1)], p, q, r);
-      float d=point_triangle_distance(gx, x[p], x[q], x[r]);
+      Real d=point_triangle_distance(gx, Vec<3,Real>(x[p]), Vec<3,Real>(x[q]), Vec<3,Real>(x[r]));
       if(d<phi(i0,j0,k0)){
-         phi(i0,j0,k0)=d;
+         phi(i0,j0,k0)=(float)d;
          closest_tri(i0,j0,k0)=closest_tri(i1,j1,k1);
       }
    }
 }
 
-static void sweep(const std::vector<Vec3ui> &tri, const std::vector<Vec3f> &x,
+static void sweep(const Vec3ui *tri, const Vec3f *x,
                   Array3f &phi, Array3i &closest_tri, const Vec3f &origin, float dx,
                   int di, int dj, int dk)
 {
@@ -127,7 +136,8 @@ static void sweep(const std::vector<Vec3ui> &tri, const std::vector<Vec3f> &x,
 }
 
 // Threaded sweep - process a range of k slices
-static void sweep_range(const std::vector<Vec3ui> &tri, const std::vector<Vec3f> &x,
+template<class Real>
+static void sweep_range(const Vec3ui *tri, const Vec3f *x,
                         Array3f &phi, Array3i &closest_tri, const Vec3f &origin, float dx,
                         int di, int dj, int dk, int k_start, int k_end)
 {
@@ -139,7 +149,7 @@ static void sweep_range(const std::vector<Vec3ui> &tri, const std::vector<Vec3f>
    else{ j0=phi.nj-2; j1=-1; }
 
    for(int k=k_start; k!=k_end; k+=dk) for(int j=j0; j!=j1; j+=dj) for(int i=i0; i!=i1; i+=di){
-      Vec3f gx(i*dx+origin[0], j*dx+origin[1], k*dx+origin[2]);
+      Vec<3,Real> gx(i*(Real)dx+origin[0], j*(Real)dx+origin[1], k*(Real)dx+origin[2]);
       check_neighbour(tri, x, phi, closest_tri, gx, i, j, k, i-di, j,    k);
       check_neighbour(tri, x, phi, closest_tri, gx, i, j, k, i,    j-dj, k);
       check_neighbour(tri, x, phi, closest_tri, gx, i, j, k, i-di, j-dj, k);
@@ -189,58 +199,139 @@ static bool point_in_triangle_2d(double x0, double y0,
 namespace sdfgen {
 namespace cpu {
 
-void make_level_set3(const std::vector<Vec3ui> &tri, const std::vector<Vec3f> &x,
-                     const Vec3f &origin, float dx, int ni, int nj, int nk,
-                     Array3f &phi, const int exact_band, int num_threads)
+// Thread count used when a call passes num_threads=0 (0 = hardware concurrency)
+static std::atomic<int> default_num_threads(0);
+
+static unsigned int resolve_num_threads(int num_threads)
+{
+   if(num_threads <= 0) num_threads = default_num_threads.load();
+   unsigned int threads = (num_threads <= 0) ? std::thread::hardware_concurrency() : (unsigned int)num_threads;
+   if(threads == 0) threads = 4; // fallback
+   return threads;
+}
+
+void set_num_threads(int num_threads)
+{
+   if(num_threads < 0){
+      throw std::invalid_argument("num_threads must be non-negative (0 = auto-detect)");
+   }
+   default_num_threads.store(num_threads);
+   // Start the workers now so the first SDF does not pay for it
+   thread_pool().reserve(resolve_num_threads(0) - 1);
+}
+
+int get_num_threads()
+{
+   return (int)resolve_num_threads(0);
+}
+
+// Shared pipeline; narrow_band skips fast sweeping and clamps |phi| to exact_band*dx.
+// Real is the precision of grid positions and point-triangle distances; phi is stored
+// as float either way
+template<class Real>
+static void make_level_set3_impl(const Vec3ui *tri, size_t num_triangles,
+                                 const Vec3f *x, size_t num_vertices,
+                                 const Vec3f &origin, float dx, int ni, int nj, int nk,
+                                 Array3f &phi, const int exact_band, int num_threads,
+                                 bool narrow_band)
 {
+   (void)num_vertices; // indices are trusted; kept for symmetry with the GPU path
+
    phi.resize(ni, nj, nk);
    phi.assign((ni+nj+nk)*dx); // upper bound on distance
    Array3i closest_tri(ni, nj, nk, -1);
    Array3i intersection_count(ni, nj, nk, 0); // intersection_count(i,j,k) is # of tri intersections in (i-1,i]x{j}x{k}
 
-   // we begin by initializing distances near the mesh, and figuring out intersection counts
-   Vec3f ijkmin, ijkmax;
-   for(unsigned int t=0; t<tri.size(); ++t){
-     unsigned int p, q, r; assign(tri[t], p, q, r);
-     // coordinates in grid to high precision
-      double fip=((double)x[p][0]-origin[0])/dx, fjp=((double)x[p][1]-origin[1])/dx, fkp=((double)x[p][2]-origin[2])/dx;
-      double fiq=((double)x[q][0]-origin[0])/dx, fjq=((double)x[q][1]-origin[1])/dx, fkq=((double)x[q][2]-origin[2])/dx;
-      double fir=((double)x[r][0]-origin[0])/dx, fjr=((double)x[r][1]-origin[1])/dx, fkr=((double)x[r][2]-origin[2])/dx;
-      // do distances nearby
-      int i0=clamp(int(min(fip,fiq,fir))-exact_band, 0, ni-1), i1=clamp(int(max(fip,fiq,fir))+exact_band+1, 0, ni-1);
-      int j0=clamp(int(min(fjp,fjq,fjr))-exact_band, 0, nj-1), j1=clamp(int(max(fjp,fjq,fjr))+exact_band+1, 0, nj-1);
-      int k0=clamp(int(min(fkp,fkq,fkr))-exact_band, 0, nk-1), k1=clamp(int(max(fkp,fkq,fkr))+exact_band+1, 0, nk-1);
-      for(int k=k0; k<=k1; ++k) for(int j=j0; j<=j1; ++j) for(int i=i0; i<=i1; ++i){
-         Vec3f gx(i*dx+origin[0], j*dx+origin[1], k*dx+origin[2]);
-         float d=point_triangle_distance(gx, x[p], x[q], x[r]);
-         if(d<phi(i,j,k)){
-            phi(i,j,k)=d;
-            closest_tri(i,j,k)=t;
-         }
+   // Determine number of threads (0 = set_num_threads() default, else auto-detect)
+   unsigned int threads = resolve_num_threads(num_threads);
+   ThreadPool &pool = thread_pool();
+
+   // we begin by initializing distances near the mesh, and figuring out intersection counts.
+   // Each task owns the cells of a range of k slices. First find the k range of every
+   // triangle's expanded box (which also covers the slices its intersections land in)
+   const unsigned int num_slabs = std::min(threads, (unsigned int)nk);
+   std::vector<int> tri_k0(num_triangles), tri_k1(num_triangles);
+   pool.parallel_for(num_slabs, [&](unsigned int s){
+      size_t tb=num_triangles*s/num_slabs, te=num_triangles*(s+1)/num_slabs;
+      for(size_t t=tb; t<te; ++t){
+         unsigned int p, q, r; assign(tri[t], p, q, r);
+         // zero-area triangles have no surface to measure distance to and no interior for the
+         // parity rays to cross (their 2D barycentrics would divide by zero), so skip them
+         if(mag2(cross(x[q]-x[p], x[r]-x[p]))==0){ tri_k0[t]=0; tri_k1[t]=-1; continue; }
+         double fkp=((double)x[p][2]-origin[2])/dx, fkq=((double)x[q][2]-origin[2])/dx, fkr=((double)x[r][2]-origin[2])/dx;
+         tri_k0[t]=clamp(int(min(fkp,fkq,fkr))-exact_band, 0, nk-1);
+         tri_k1[t]=clamp(int(max(fkp,fkq,fkr))+exact_band+1, 0, nk-1);
       }
-      // and do intersection counts
-      j0=clamp((int)std::ceil(min(fjp,fjq,fjr)), 0, nj-1);
-      j1=clamp((int)std::floor(max(fjp,fjq,fjr)), 0, nj-1);
-      k0=clamp((int)std::ceil(min(fkp,fkq,fkr)), 0, nk-1);
-      k1=clamp((int)std::floor(max(fkp,fkq,fkr)), 0, nk-1);
-      for(int k=k0; k<=k1; ++k) for(int j=j0; j<=j1; ++j){
-         double a, b, c;
-         if(point_in_triangle_2d(j, k, fjp, fkp, fjq, fkq, fjr, fkr, a, b, c)){
-            double fi=a*fip+b*fiq+c*fir; // intersection i coordinate
-            int i_interval=int(std::ceil(fi)); // intersection is in (i_interval-1,i_interval]
-            if(i_interval<0) ++intersection_count(0, j, k); // we enlarge the first interval to include everything to the -x direction
-            else if(i_interval<ni) ++intersection_count(i_interval,j,k);
-            // we ignore intersections that are beyond the +x side of the grid
+   });
+   // then hand each slab the triangles that touch it, in ascending order, so each cell sees
+   // the same sequence of updates as a serial run (bitwise identical result)
+   std::vector<unsigned int> slab_of_k(nk);
+   for(unsigned int s=0; s<num_slabs; ++s)
+      for(int k=(int)((size_t)nk*s/num_slabs); k<(int)((size_t)nk*(s+1)/num_slabs); ++k) slab_of_k[k]=s;
+   std::vector<std::vector<unsigned int> > slab_tris(num_slabs);
+   for(unsigned int t=0; t<num_triangles; ++t){
+      if(tri_k1[t]<tri_k0[t]) continue;
+      for(unsigned int s=slab_of_k[tri_k0[t]]; s<=slab_of_k[tri_k1[t]]; ++s) slab_tris[s].push_back(t);
+   }
+   auto init_slices=[&](int kb, int ke, const std::vector<unsigned int> &tris){
+      for(size_t n=0; n<tris.size(); ++n){
+         unsigned int t=tris[n];
+        unsigned int p, q, r; assign(tri[t], p, q, r);
+        // coordinates in grid to high precision
+         double fip=((double)x[p][0]-origin[0])/dx, fjp=((double)x[p][1]-origin[1])/dx, fkp=((double)x[p][2]-origin[2])/dx;
+         double fiq=((double)x[q][0]-origin[0])/dx, fjq=((double)x[q][1]-origin[1])/dx, fkq=((double)x[q][2]-origin[2])/dx;
+         double fir=((double)x[r][0]-origin[0])/dx, fjr=((double)x[r][1]-origin[1])/dx, fkr=((double)x[r][2]-origin[2])/dx;
+         // do distances nearby; in narrow-band mode triangles whose band misses the grid
+         // are skipped here (their cells would be clamped anyway) but still counted below
+         bool outside=narrow_band &&
+            (max(fip,fiq,fir)+exact_band<0 || min(fip,fiq,fir)-exact_band>ni-1 ||
+             max(fjp,fjq,fjr)+exact_band<0 || min(fjp,fjq,fjr)-exact_band>nj-1 ||
+             max(fkp,fkq,fkr)+exact_band<0 || min(fkp,fkq,fkr)-exact_band>nk-1);
+         int i0=clamp(int(min(fip,fiq,fir))-exact_band, 0, ni-1), i1=clamp(int(max(fip,fiq,fir))+exact_band+1, 0, ni-1);
+         int j0=clamp(int(min(fjp,fjq,fjr))-exact_band, 0, nj-1), j1=clamp(int(max(fjp,fjq,fjr))+exact_band+1, 0, nj-1);
+         int k0=clamp(int(min(fkp,fkq,fkr))-exact_band, 0, nk-1), k1=clamp(int(max(fkp,fkq,fkr))+exact_band+1, 0, nk-1);
+         k0=max(k0, kb); k1=min(k1, ke-1);
+         if(!outside) for(int k=k0; k<=k1; ++k) for(int j=j0; j<=j1; ++j) for(int i=i0; i<=i1; ++i){
+            Vec<3,Real> gx(i*(Real)dx+origin[0], j*(Real)dx+origin[1], k*(Real)dx+origin[2]);
+            Real d=point_triangle_distance(gx, Vec<3,Real>(x[p]), Vec<3,Real>(x[q]), Vec<3,Real>(x[r]));
+            if(d<phi(i,j,k)){
+               phi(i,j,k)=(float)d;
+               closest_tri(i,j,k)=t;
+            }
          }
+         // and do intersection counts
+         j0=clamp((int)std::ceil(min(fjp,fjq,fjr)), 0, nj-1);
+         j1=clamp((int)std::floor(max(fjp,fjq,fjr)), 0, nj-1);
+         k0=max(clamp((int)std::ceil(min(fkp,fkq,fkr)), 0, nk-1), kb);
+         k1=min(clamp((int)std::floor(max(fkp,fkq,fkr)), 0, nk-1), ke-1);
+         for(int k=k0; k<=k1; ++k) for(int j=j0; j<=j1; ++j){
+            double a, b, c;
+            if(point_in_triangle_2d(j, k, fjp, fkp, fjq, fkq, fjr, fkr, a, b, c)){
+               double fi=a*fip+b*fiq+c*fir; // intersection i coordinate
+               int i_interval=int(std::ceil(fi)); // intersection is in (i_interval-1,i_interval]
+               if(i_interval<0) ++intersection_count(0, j, k); // we enlarge the first interval to include everything to the -x direction
+               else if(i_interval<ni) ++intersection_count(i_interval,j,k);
+               // we ignore intersections that are beyond the +x side of the grid
+            }
+         }
+      }
+   };
+   pool.parallel_for(num_slabs, [&](unsigned int s){
+      init_slices((int)((size_t)nk*s/num_slabs), (int)((size_t)nk*(s+1)/num_slabs), slab_tris[s]);
+   });
+
+   if(narrow_band){
+      // Every grid point within exact_band*dx of a triangle lies in that triangle's
+      // expanded box, so those distances are already exact; clamp everything else
+      const float band=exact_band*dx;
+      for(size_t n=0; n<phi.a.size(); ++n){
+         if(phi.a[n]>band) phi.a[n]=band;
       }
    }
 
    // Multi-threaded fast sweeping (FluidX3D approach - simple and fast)
-   // Determine number of threads (0 = auto-detect)
-   unsigned int threads = (num_threads <= 0) ? std::thread::hardware_concurrency() : (unsigned int)num_threads;
-   if(threads == 0) threads = 4; // fallback
-
-   for(unsigned int pass=0; pass<2; ++pass){
+   const unsigned int num_passes = narrow_band ? 0 : 2; // no far field in narrow-band mode
+   for(unsigned int pass=0; pass<num_passes; ++pass){
       // For each of the 8 sweep directions
       int sweep_dirs[8][3] = {
          {+1, +1, +1}, {-1, -1, -1}, {+1, +1, -1}, {-1, -1, +1},
@@ -258,7 +349,7 @@ void make_level_set3(const std::vector<Vec3ui> &tri, const std::vector<Vec3f> &x
          else{ k0=nk-2; k1=-1; }
 
          // Split work among threads
-         std::vector<std::thread> thread_pool;
+         std::vector<std::pair<int, int>> slabs;
          int k_range = (dk>0) ? (k1-k0) : (k0-k1);
 
          // CRITICAL: Don't use more threads than we have slices
@@ -278,29 +369,69 @@ void make_level_set3(const std::vector<Vec3ui> &tri, const std::vector<Vec3f> &x
             }
 
             if((dk>0 && thread_k_start < thread_k_end) || (dk<0 && thread_k_start > thread_k_end)){
-               thread_pool.emplace_back(sweep_range, std::ref(tri), std::ref(x),
-                                   std::ref(phi), std::ref(closest_tri),
-                                   origin, dx, di, dj, dk, thread_k_start, thread_k_end);
+               slabs.emplace_back(thread_k_start, thread_k_end);
             }
          }
 
-         // Wait for all threads to complete
-         for(auto& thread : thread_pool){
-            thread.join();
-         }
+         // Run the slabs on the persistent pool (returns once all are done)
+         pool.parallel_for((unsigned int)slabs.size(), [&](unsigned int t){
+            sweep_range<Real>(tri, x, phi, closest_tri, origin, dx, di, dj, dk,
+                        slabs[t].first, slabs[t].second);
+         });
       }
    }
 
-   // then figure out signs (inside/outside) from intersection counts
-   for(int k=0; k<nk; ++k) for(int j=0; j<nj; ++j){
-      int total_count=0;
-      for(int i=0; i<ni; ++i){
-         total_count+=intersection_count(i,j,k);
-         if(total_count%2==1){ // if parity of intersections so far is odd,
-            phi(i,j,k)=-phi(i,j,k); // we are inside the mesh
+   // then figure out signs (inside/outside) from intersection counts; every (j,k) row is
+   // independent, so the k slices are split across the pool as above
+   pool.parallel_for(num_slabs, [&](unsigned int s){
+      int kb=(int)((size_t)nk*s/num_slabs), ke=(int)((size_t)nk*(s+1)/num_slabs);
+      for(int k=kb; k<ke; ++k) for(int j=0; j<nj; ++j){
+         int total_count=0;
+         for(int i=0; i<ni; ++i){
+            total_count+=intersection_count(i,j,k);
+            if(total_count%2==1){ // if parity of intersections so far is odd,
+               phi(i,j,k)=-phi(i,j,k); // we are inside the mesh
+            }
          }
       }
-   }
+   });
+}
+
+void make_level_set3(const Vec3ui *tri, size_t num_triangles,
+                     const Vec3f *x, size_t num_vertices,
+                     const Vec3f &origin, float dx, int ni, int nj, int nk,
+                     Array3f &phi, const int exact_band, int num_threads,
+                     bool accumulate_double)
+{
+   if(accumulate_double)
+      make_level_set3_impl<double>(tri, num_triangles, x, num_vertices,
+                                   origin, dx, ni, nj, nk, phi, exact_band, num_threads, false);
+   else
+      make_level_set3_impl<float>(tri, num_triangles, x, num_vertices,
+                                  origin, dx, ni, nj, nk, phi, exact_band, num_threads, false);
+}
+
+void make_level_set3_narrowband(const Vec3ui *tri, size_t num_triangles,
+                                const Vec3f *x, size_t num_vertices,
+                                const Vec3f &origin, float dx, int ni, int nj, int nk,
+                                Array3f &phi, const int exact_band, int num_threads,
+                                bool accumulate_double)
+{
+   if(accumulate_double)
+      make_level_set3_impl<double>(tri, num_triangles, x, num_vertices,
+                                   origin, dx, ni, nj, nk, phi, exact_band, num_threads, true);
+   else
+      make_level_set3_impl<float>(tri, num_triangles, x, num_vertices,
+                                  origin, dx, ni, nj, nk, phi, exact_band, num_threads, true);
+}
+
+void make_level_set3(const std::vector<Vec3ui> &tri, const std::vector<Vec3f> &x,
+                     const Vec3f &origin, float dx, int ni, int nj, int nk,
+                     Array3f &phi, const int exact_band, int num_threads,
+                     bool accumulate_double)
+{
+   make_level_set3(tri.data(), tri.size(), x.data(), x.size(),
+                   origin, dx, ni, nj, nk, phi, exact_band, num_threads, accumulate_double);
 }
 
 } // namespace cpu
@@ -6,6 +6,8 @@
 
 #include "array3.h"
 #include "vec.h"
+#include <cstddef>
+#include <vector>
 
 namespace sdfgen {
 namespace cpu {
@@ -19,7 +21,9 @@ namespace cpu {
  * regions. The mesh should be closed and manifold for accurate inside/outside signs; triangle
  * soups will produce correct absolute distances but may have incorrect signs. The implementation
  * uses multi-threading to parallelize the computation across multiple CPU cores for improved
- * performance on large grids.
+ * performance on large grids. Every phase splits the grid into k slabs; only the fast
+ * sweeping phase reads cells of a neighbouring slab, the exact-band and sign phases give
+ * bitwise the same result for any thread count.
  *
  * @param tri Triangle indices defining mesh topology, each Vec3ui contains 3 vertex indices
  * @param x Vertex positions in world coordinates
@@ -31,14 +35,78 @@ namespace cpu {
  * @param phi Output signed distance field array (will be resized to nx*ny*nz)
  * @param exact_band Width of exact computation band in grid cells (default: 1)
  * @param num_threads Number of CPU threads to use, 0 = auto-detect via hardware_concurrency (default: 0)
+ * @param accumulate_double Compute grid positions and point-triangle distances in double
+ *        precision (phi is still stored as float); helps meshes far from the origin, where
+ *        float coordinates cancel most significant digits (default: false)
  *
  * @note Distances within exact_band cells of triangles are computed exactly
  * @note Distances beyond exact_band may not be to the closest triangle but to a nearby one
+ * @note Zero-area triangles (collapsed to a point or segment) are skipped by every phase
  * @note Thread count is automatically determined if num_threads=0, using std::thread::hardware_concurrency()
  */
 void make_level_set3(const std::vector<Vec3ui> &tri, const std::vector<Vec3f> &x,
                      const Vec3f &origin, float dx, int nx, int ny, int nz,
-                     Array3f &phi, const int exact_band=1, int num_threads=0);
+                     Array3f &phi, const int exact_band=1, int num_threads=0,
+                     bool accumulate_double=false);
+
+/**
+ * @brief Generate signed distance field from caller-owned mesh arrays
+ *
+ * Same as the std::vector overload, but reads the mesh directly from contiguous arrays
+ * (e.g. NumPy buffers) so no copy is made. The arrays must stay valid and unmodified for
+ * the duration of the call.
+ *
+ * @param tri Pointer to num_triangles triangle index triples
+ * @param num_triangles Number of triangles
+ * @param x Pointer to num_vertices vertex positions
+ * @param num_vertices Number of vertices
+ */
+void make_level_set3(const Vec3ui *tri, size_t num_triangles,
+                     const Vec3f *x, size_t num_vertices,
+                     const Vec3f &origin, float dx, int nx, int ny, int nz,
+                     Array3f &phi, const int exact_band=1, int num_threads=0,
+                     bool accumulate_double=false);
+
+/**
+ * @brief Generate a narrow-band signed distance field on the CPU
+ *
+ * Computes exact distances only for grid points within exact_band cells of the surface
+ * and skips the fast sweeping phase entirely; every other cell is set to +/-exact_band*dx
+ * (sign from the usual ray-parity pass). Triangles whose band lies completely outside
+ * the grid are culled from the distance pass. Cost is proportional to the surface area
+ * of the mesh rather than the grid volume, which suits consumers that only need the SDF
+ * near the surface (collision, rendering, level-set narrow bands).
+ *
+ * @param tri Pointer to num_triangles triangle index triples
+ * @param num_triangles Number of triangles
+ * @param x Pointer to num_vertices vertex positions
+ * @param num_vertices Number of vertices
+ * @param exact_band Band half-width in grid cells; |phi| is clamped to exact_band*dx
+ * @param num_threads Number of CPU threads, 0 = set_num_threads() default (default: 0); the
+ *        result is bitwise the same for any thread count
+ * @param accumulate_double Compute distances in double precision (see make_level_set3)
+ */
+void make_level_set3_narrowband(const Vec3ui *tri, size_t num_triangles,
+                                const Vec3f *x, size_t num_vertices,
+                                const Vec3f &origin, float dx, int nx, int ny, int nz,
+                                Array3f &phi, const int exact_band=1, int num_threads=0,
+                                bool accumulate_double=false);
+
+/**
+ * @brief Set the default CPU thread count for calls that pass num_threads=0
+ *
+ * CPU sweeps run on a persistent worker pool shared by all calls, so this also starts
+ * the workers up front. An explicit num_threads > 0 on a call still takes precedence.
+ *
+ * @param num_threads Thread count, 0 = auto-detect via hardware_concurrency
+ * @throws std::invalid_argument if num_threads is negative
+ */
+void set_num_threads(int num_threads);
+
+/**
+ * @brief Get the thread count used for calls that pass num_threads=0
+ */
+int get_num_threads();
 
 } // namespace cpu
 } // namespace sdfgen
@@ -0,0 +1,83 @@
+// SDFGen - Signed Distance Field Generator
+// Copyright (c) 2015 Christopher Batty, 2025 Brad Chamberlain
+// Licensed under the MIT License - see LICENSE file
+
+#include "thread_pool.h"
+
+namespace sdfgen {
+namespace cpu {
+
+ThreadPool::ThreadPool() : stop_(false) {}
+
+ThreadPool::~ThreadPool() {
+    {
+        std::lock_guard<std::mutex> lock(mutex_);
+        stop_ = true;
+    }
+    task_ready_.notify_all();
+    for (auto& worker : workers_) {
+        worker.join();
+    }
+}
+
+void ThreadPool::reserve(unsigned int num_workers) {
+    std::lock_guard<std::mutex> lock(mutex_);
+    while (workers_.size() < num_workers) {
+        workers_.emplace_back(&ThreadPool::worker_loop, this);
+    }
+}
+
+void ThreadPool::worker_loop() {
+    for (;;) {
+        std::function<void()> task;
+        {
+            std::unique_lock<std::mutex> lock(mutex_);
+            task_ready_.wait(lock, [this] { return stop_ || !tasks_.empty(); });
+            if (stop_ && tasks_.empty()) return;
+            task = std::move(tasks_.front());
+            tasks_.pop_front();
+        }
+        task();
+    }
+}
+
+void ThreadPool::parallel_for(unsigned int count, const std::function<void(unsigned int)>& fn) {
+    if (count == 0) return;
+    if (count == 1) {
+        fn(0);
+        return;
+    }
+
+    reserve(count - 1);
+
+    // Completion state for this batch lives on the caller's stack; parallel_for does not
+    // return before every queued task has signalled it
+    std::mutex done_mutex;
+    std::condition_variable done;
+    unsigned int remaining = count - 1;
+
+    {
+        std::lock_guard<std::mutex> lock(mutex_);
+        for (unsigned int t = 1; t < count; ++t) {
+            tasks_.emplace_back([&, t] {
+                fn(t);
+                std::lock_guard<std::mutex> done_lock(done_mutex);
+                if (--remaining == 0) done.notify_one();
+            });
+        }
+    }
+    task_ready_.notify_all();
+
+    fn(0);
+
+    std::unique_lock<std::mutex> done_lock(done_mutex);
+    done.wait(done_lock, [&] { return remaining == 0; });
+}
+
+ThreadPool& thread_pool() {
+    static ThreadPool pool;
+    return pool;
+}
+
+} // namespace cpu
+} // namespace sdfgen
@@ -0,0 +1,70 @@
+// SDFGen - Signed Distance Field Generator
+// Copyright (c) 2015 Christopher Batty, 2025 Brad Chamberlain
+// Licensed under the MIT License - see LICENSE file
+
+#pragma once
+
+#include <condition_variable>
+#include <deque>
+#include <functional>
+#include <mutex>
+#include <thread>
+#include <vector>
+
+namespace sdfgen {
+namespace cpu {
+
+/**
+ * @brief Persistent worker threads shared by every CPU SDF computation
+ *
+ * The fast sweeping phase runs 16 short parallel sections per call (2 passes x 8
+ * directions), plus one each for the exact-band and sign phases. Spawning and joining
+ * fresh std::threads for each of them dominates the runtime on small grids, so the
+ * workers are created once and reused across sections and across calls. The pool only
+ * grows: a request for more threads than it currently holds spawns the missing workers,
+ * and they stay alive until process exit.
+ *
+ * parallel_for() may be called concurrently from several threads (e.g. independent SDFs
+ * generated on Python worker threads); their tasks share the worker queue.
+ */
+class ThreadPool {
+public:
+    ThreadPool();
+    ~ThreadPool();
+
+    ThreadPool(const ThreadPool&) = delete;
+    ThreadPool& operator=(const ThreadPool&) = delete;
+
+    /**
+     * @brief Run fn(0), ..., fn(count - 1) in parallel and wait for all of them
+     *
+     * The calling thread executes one of the tasks itself, so at most count - 1 workers
+     * are needed. Tasks must not throw.
+     *
+     * @param count Number of tasks
+     * @param fn Task body, called with the task index
+     */
+    void parallel_for(unsigned int count, const std::function<void(unsigned int)>& fn);
+
+    /**
+     * @brief Make sure at least num_workers worker threads exist
+     */
+    void reserve(unsigned int num_workers);
+
+private:
+    void worker_loop();
+
+    std::vector<std::thread> workers_;
+    std::deque<std::function<void()>> tasks_;
+    std::mutex mutex_;
+    std::condition_variable task_ready_;
+    bool stop_;
+};
+
+/**
+ * @brief Process-wide pool used by make_level_set3()
+ */
+ThreadPool& thread_pool();
+
+} // namespace cpu
+} // namespace sdfgen
@@ -9,6 +9,15 @@
 #include <cmath>
 #include <cfloat>
 #include <cstddef>
+#include <cstdint>
+#include <cstring>
+#include <iterator>
+#include <list>
+#include <memory>
+#include <mutex>
+#include <unordered_map>
+#include <utility>
+#include <vector>
 
 // CUDA error checking macro
 #define CUDA_CHECK(err) { \
@@ -133,6 +142,22 @@ __device__ float dot_prod(const Vec3f& a, const Vec3f& b) {
     return a.v[0]*b.v[0] + a.v[1]*b.v[1] + a.v[2]*b.v[2];
 }
 
+/**
+ * @brief Test whether a triangle has zero area (collapsed to a point or segment)
+ * @param p First vertex
+ * @param q Second vertex
+ * @param r Third vertex
+ * @return True if the cross product of its edges (q - p) x (r - p) is zero
+ */
+__device__ bool zero_area(const Vec3f& p, const Vec3f& q, const Vec3f& r) {
+    float ax = q.v[0] - p.v[0], ay = q.v[1] - p.v[1], az = q.v[2] - p.v[2];
+    float bx = r.v[0] - p.v[0], by = r.v[1] - p.v[1], bz = r.v[2] - p.v[2];
+    float cx = ay*bz - az*by;
+    float cy = az*bx - ax*bz;
+    float cz = ax*by - ay*bx;
+    return cx*cx + cy*cy + cz*cz == 0.0f;
+}
+
 /**
  * @brief Compute Euclidean distance between two 3D points
  * @param a First point
@@ -357,7 +382,7 @@ __global__ void initialize_grids_kernel(DistTriPair* dist_tri, int* intersection
  * simultaneously. Also tracks ray-triangle intersections for sign determination.
  *
  * Each thread processes one triangle and updates all grid cells within its bounding box
- * expanded by exact_band cells.
+ * expanded by exact_band cells. Zero-area triangles are skipped.
  *
  * @param tri Triangle indices (num_triangles elements)
  * @param x Vertex positions
@@ -385,6 +410,11 @@ __global__ void near_band_distance_kernel(
     Vec3f q = x[pqr.v[1]];
     Vec3f r = x[pqr.v[2]];
 
+    // Zero-area triangles bound nothing and would only perturb the sign parity at
+    // their degenerate edges; skip them, as the CPU backends do. Nothing is seeded
+    // from them, so the sweep and jump flooding phases never see them either.
+    if (zero_area(p, q, r)) return;
+
     // Compute grid coordinates
     double fip = ((double)p.v[0] - origin.v[0]) / dx;
     double fjp = ((double)p.v[1] - origin.v[1]) / dx;
@@ -550,6 +580,104 @@ __global__ void fast_sweep_eikonal_kernel(
     phi_write[idx] = new_phi;
 }
 
+// ============================================================================
+// Kernel 3b: Jump Flooding
+// ============================================================================
+
+/**
+ * @brief Load a triangle's vertices through the read-only data cache
+ * @param tri Triangle indices
+ * @param x Vertex positions
+ * @param t Triangle index to load
+ * @param p Output first vertex
+ * @param q Output second vertex
+ * @param r Output third vertex
+ */
+__device__ inline void load_triangle_ldg(const Vec3ui* __restrict__ tri, const Vec3f* __restrict__ x,
+                                         int t, Vec3f& p, Vec3f& q, Vec3f& r) {
+    const unsigned int a = __ldg(&tri[t].v[0]);
+    const unsigned int b = __ldg(&tri[t].v[1]);
+    const unsigned int c = __ldg(&tri[t].v[2]);
+    for (int d = 0; d < 3; ++d) {
+        p.v[d] = __ldg(&x[a].v[d]);
+        q.v[d] = __ldg(&x[b].v[d]);
+        r.v[d] = __ldg(&x[c].v[d]);
+    }
+}
+
+/**
+ * @brief CUDA kernel for one jump-flooding pass over closest-triangle indices
+ *
+ * Each cell looks at its 26 neighbours at offset +-step along every axis and adopts
+ * any neighbour's closest triangle that is nearer to the cell's own grid point than
+ * its current one. Running passes with step = N/2, N/4, ..., 1 spreads the triangle
+ * indices seeded by near_band_distance_kernel across the whole grid in log2(N)
+ * launches, and every far-field distance is an exact point-triangle distance to the
+ * propagated triangle instead of an Eikonal estimate.
+ *
+ * Uses double-buffering (read/write) like fast_sweep_eikonal_kernel; cells that have
+ * not been reached yet carry tri_idx -1.
+ *
+ * @param tri Triangle indices
+ * @param x Vertex positions
+ * @param phi_read Current unsigned distance per cell
+ * @param tri_read Current closest triangle per cell (-1 if none)
+ * @param phi_write Updated unsigned distance per cell
+ * @param tri_write Updated closest triangle per cell
+ * @param step Neighbour offset in cells for this pass
+ * @param origin Grid origin in world coordinates
+ * @param dx Grid cell spacing
+ * @param ni Grid dimension in X
+ * @param nj Grid dimension in Y
+ * @param nk Grid dimension in Z
+ */
+__global__ void jump_flood_kernel(
+    const Vec3ui* __restrict__ tri, const Vec3f* __restrict__ x,
+    const float* __restrict__ phi_read, const int* __restrict__ tri_read,
+    float* __restrict__ phi_write, int* __restrict__ tri_write,
+    int step, Vec3f origin, float dx, int ni, int nj, int nk)
+{
+    int i = blockIdx.x * blockDim.x + threadIdx.x;
+    int j = blockIdx.y * blockDim.y + threadIdx.y;
+    int k = blockIdx.z * blockDim.z + threadIdx.z;
+
+    if (i >= ni || j >= nj || k >= nk) return;
+
+    int idx = grid_index(i, j, k, ni, nj);
+    float best_dist = __ldg(&phi_read[idx]);
+    int best_tri = __ldg(&tri_read[idx]);
+
+    float gx_data[3] = {i * dx + origin.v[0], j * dx + origin.v[1], k * dx + origin.v[2]};
+    const Vec3f& gx = *reinterpret_cast<Vec3f*>(gx_data);
+
+    for (int dk = -1; dk <= 1; ++dk) {
+        int nk_ = k + dk * step;
+        if (nk_ < 0 || nk_ >= nk) continue;
+        for (int dj = -1; dj <= 1; ++dj) {
+            int nj_ = j + dj * step;
+            if (nj_ < 0 || nj_ >= nj) continue;
+            for (int di = -1; di <= 1; ++di) {
+                int ni_ = i + di * step;
+                if (ni_ < 0 || ni_ >= ni) continue;
+
+                int t = __ldg(&tri_read[grid_index(ni_, nj_, nk_, ni, nj)]);
+                if (t < 0 || t == best_tri) continue;
+
+                Vec3f p, q, r;
+                load_triangle_ldg(tri, x, t, p, q, r);
+                float d = point_triangle_distance(gx, p, q, r);
+                if (d < best_dist) {
+                    best_dist = d;
+                    best_tri = t;
+                }
+            }
+        }
+    }
+
+    phi_write[idx] = best_dist;
+    tri_write[idx] = best_tri;
+}
+
 // ============================================================================
 // Kernel 4: Sign Correction
 // ============================================================================
@@ -588,13 +716,209 @@ __global__ void sign_correction_kernel(float* phi, const int* intersection_count
     }
 }
 
+// ============================================================================
+// Device Mesh Cache
+// ============================================================================
+
+// Upper bound on device memory held by cached meshes; larger meshes are uploaded per call
+constexpr size_t DEVICE_MESH_CACHE_CAPACITY = size_t(256) << 20;  // 256 MB
+
+constexpr uint64_t FNV_OFFSET_BASIS = 14695981039346656037ull;
+constexpr uint64_t FNV_PRIME = 1099511628211ull;
+
+/**
+ * @brief FNV-1a hash over a byte range, consumed in 64-bit words for speed
+ */
+static uint64_t hash_bytes(uint64_t h, const void* data, size_t size) {
+    const unsigned char* bytes = static_cast<const unsigned char*>(data);
+    const size_t num_words = size / sizeof(uint64_t);
+    for (size_t w = 0; w < num_words; ++w) {
+        uint64_t word;
+        std::memcpy(&word, bytes + w * sizeof(uint64_t), sizeof(uint64_t));
+        h ^= word;
+        h *= FNV_PRIME;
+    }
+    for (size_t b = num_words * sizeof(uint64_t); b < size; ++b) {
+        h ^= bytes[b];
+        h *= FNV_PRIME;
+    }
+    return h;
+}
+
+/**
+ * @brief Bucket key of a mesh: hash of its sizes and the full vertex/index data
+ *
+ * Word-wise FNV-1a is cheap but not collision resistant (e.g. flipping the sign bit of
+ * any two words cancels out), so the key only selects a cache slot; a hit is reused
+ * only after DeviceMesh::matches() confirms the contents byte for byte.
+ */
+static uint64_t mesh_key(const Vec3ui* tri, size_t num_triangles,
+                         const Vec3f* x, size_t num_vertices) {
+    const uint64_t sizes[2] = {num_triangles, num_vertices};
+    uint64_t h = hash_bytes(FNV_OFFSET_BASIS, sizes, sizeof(sizes));
+    h = hash_bytes(h, tri, num_triangles * sizeof(Vec3ui));
+    h = hash_bytes(h, x, num_vertices * sizeof(Vec3f));
+    return h;
+}
+
+/**
+ * @brief Triangle and vertex buffers resident on the device
+ *
+ * Owned through shared_ptr so an entry evicted from the cache stays alive until every
+ * in-flight SDF computation using it has finished. Cached entries also keep a host copy
+ * of the mesh so a hash hit can be checked against the caller's data.
+ */
+struct DeviceMesh {
+    Vec3ui* tri = nullptr;
+    Vec3f* x = nullptr;
+    size_t bytes = 0;
+    std::vector<Vec3ui> host_tri;
+    std::vector<Vec3f> host_x;
+
+    DeviceMesh(const Vec3ui* h_tri, size_t num_triangles, const Vec3f* h_x, size_t num_vertices,
+               bool keep_host_copy) {
+        const size_t tri_bytes = num_triangles * sizeof(Vec3ui);
+        const size_t x_bytes = num_vertices * sizeof(Vec3f);
+        CUDA_CHECK(cudaMalloc(&tri, tri_bytes));
+        CUDA_CHECK(cudaMalloc(&x, x_bytes));
+        CUDA_CHECK(cudaMemcpy(tri, h_tri, tri_bytes, cudaMemcpyHostToDevice));
+        CUDA_CHECK(cudaMemcpy(x, h_x, x_bytes, cudaMemcpyHostToDevice));
+        // Pageable uploads may still be in flight; finish them before other
+        // threads' streams can read the buffers
+        CUDA_CHECK(cudaStreamSynchronize(cudaStreamPerThread));
+        bytes = tri_bytes + x_bytes;
+        if (keep_host_copy) {
+            host_tri.assign(h_tri, h_tri + num_triangles);
+            host_x.assign(h_x, h_x + num_vertices);
+        }
+    }
+
+    ~DeviceMesh() {
+        // Errors ignored: may run during process teardown after the runtime unloads
+        cudaFree(tri);
+        cudaFree(x);
+    }
+
+    /**
+     * @brief Whether this entry holds exactly the given mesh (requires the host copy)
+     */
+    bool matches(const Vec3ui* h_tri, size_t num_triangles,
+                 const Vec3f* h_x, size_t num_vertices) const {
+        return host_tri.size() == num_triangles && host_x.size() == num_vertices &&
+               std::memcmp(host_tri.data(), h_tri, num_triangles * sizeof(Vec3ui)) == 0 &&
+               std::memcmp(host_x.data(), h_x, num_vertices * sizeof(Vec3f)) == 0;
+    }
+
+    DeviceMesh(const DeviceMesh&) = delete;
+    DeviceMesh& operator=(const DeviceMesh&) = delete;
+};
+
+/**
+ * @brief Thread-safe LRU cache of uploaded meshes, bounded by DEVICE_MESH_CACHE_CAPACITY
+ *
+ * The mutex only guards the index; uploads run unlocked so concurrent callers with
+ * different meshes do not queue behind one transfer.
+ */
+class DeviceMeshCache {
+public:
+    std::shared_ptr<const DeviceMesh> acquire(const Vec3ui* tri, size_t num_triangles,
+                                              const Vec3f* x, size_t num_vertices) {
+        const size_t bytes = num_triangles * sizeof(Vec3ui) + num_vertices * sizeof(Vec3f);
+        if (bytes > DEVICE_MESH_CACHE_CAPACITY) {
+            // Too large to keep resident; upload for this call only
+            return std::make_shared<DeviceMesh>(tri, num_triangles, x, num_vertices, false);
+        }
+
+        const uint64_t key = mesh_key(tri, num_triangles, x, num_vertices);
+        if (auto hit = lookup(key, tri, num_triangles, x, num_vertices)) return hit;
+
+        auto mesh = std::make_shared<DeviceMesh>(tri, num_triangles, x, num_vertices, true);
+
+        std::lock_guard<std::mutex> lock(mutex_);
+
+        auto found = index_.find(key);
+        if (found != index_.end()) {
+            if (found->second->second->matches(tri, num_triangles, x, num_vertices)) {
+                // Another thread uploaded the same mesh meanwhile; share its copy
+                lru_.splice(lru_.begin(), lru_, found->second);
+                return found->second->second;
+            }
+            // Hash collision with a different mesh: replace the older entry
+            erase(found->second);
+        }
+
+        // Evict least recently used entries until the new mesh fits
+        while (!lru_.empty() && total_bytes_ + bytes > DEVICE_MESH_CACHE_CAPACITY) {
+            erase(std::prev(lru_.end()));
+        }
+
+        lru_.emplace_front(key, mesh);
+        index_[key] = lru_.begin();
+        total_bytes_ += bytes;
+        return mesh;
+    }
+
+    void clear() {
+        std::lock_guard<std::mutex> lock(mutex_);
+        lru_.clear();
+        index_.clear();
+        total_bytes_ = 0;
+    }
+
+private:
+    using Entry = std::pair<uint64_t, std::shared_ptr<const DeviceMesh>>;
+
+    /**
+     * @brief Cached copy of the mesh if one with identical contents is resident, else null
+     */
+    std::shared_ptr<const DeviceMesh> lookup(uint64_t key, const Vec3ui* tri, size_t num_triangles,
+                                             const Vec3f* x, size_t num_vertices) {
+        std::lock_guard<std::mutex> lock(mutex_);
+        auto found = index_.find(key);
+        if (found == index_.end() ||
+            !found->second->second->matches(tri, num_triangles, x, num_vertices)) {
+            return nullptr;
+        }
+        // Hit: mark as most recently used
+        lru_.splice(lru_.begin(), lru_, found->second);
+        return found->second->second;
+    }
+
+    /**
+     * @brief Drop one entry; caller holds mutex_
+     */
+    void erase(std::list<Entry>::iterator it) {
+        total_bytes_ -= it->second->bytes;
+        index_.erase(it->first);
+        lru_.erase(it);
+    }
+
+    std::mutex mutex_;
+    std::list<Entry> lru_;  ///< Most recently used first
+    std::unordered_map<uint64_t, std::list<Entry>::iterator> index_;
+    size_t total_bytes_ = 0;
+};
+
+static DeviceMeshCache& device_mesh_cache() {
+    static DeviceMeshCache cache;
+    return cache;
+}
+
+void clear_device_cache() {
+    device_mesh_cache().clear();
+}
+
 // ============================================================================
 // Host Orchestrator
 // ============================================================================
 
-void make_level_set3(const std::vector<Vec3ui> &tri, const std::vector<Vec3f> &x,
-                     const Vec3f &origin, float dx, int ni, int nj, int nk,
-                     Array3f &phi, const int exact_band)
+/**
+ * @brief Shared GPU pipeline; jump_flood selects the far-field propagation kernel
+ */
+static void make_level_set3_impl(const Vec3ui *tri, size_t num_triangles,
+                                 const Vec3f *x, size_t num_vertices,
+                                 const Vec3f &origin, float dx, int ni, int nj, int nk,
+                                 Array3f &phi, const int exact_band, bool jump_flood)
 {
     // Get device info
     int device;
@@ -604,15 +928,17 @@ void make_level_set3(const std::vector<Vec3ui> &tri, const std::vector<Vec3f> &x
     // std::cout << "GPU: " << props.name << " (Compute " << props.major << "." << props.minor << ")" << std::endl;
 
     const size_t num_grid_cells = (size_t)ni * nj * nk;
-    const size_t num_triangles = tri.size();
-    const size_t num_vertices = x.size();
 
     // std::cout << "Grid: " << ni << "x" << nj << "x" << nk << " = " << num_grid_cells << " cells" << std::endl;
     // std::cout << "Mesh: " << num_vertices << " vertices, " << num_triangles << " triangles" << std::endl;
 
+    // Mesh buffers come from the device cache, so repeated calls on the same mesh
+    // (e.g. a resolution sweep) upload it only once
+    std::shared_ptr<const DeviceMesh> mesh = device_mesh_cache().acquire(tri, num_triangles, x, num_vertices);
+    const Vec3ui* d_tri = mesh->tri;
+    const Vec3f* d_x = mesh->x;
+
     // Allocate device memory
-    Vec3ui* d_tri;
-    Vec3f* d_x;
     DistTriPair* d_dist_tri;
     int* d_intersection_count;
     float* d_phi_read;
@@ -620,8 +946,6 @@ void make_level_set3(const std::vector<Vec3ui> &tri, const std::vector<Vec3f> &x
     int* d_closest_tri_read;
     int* d_closest_tri_write;
 
-    CUDA_CHECK(cudaMalloc(&d_tri, num_triangles * sizeof(Vec3ui)));
-    CUDA_CHECK(cudaMalloc(&d_x, num_vertices * sizeof(Vec3f)));
     CUDA_CHECK(cudaMalloc(&d_dist_tri, num_grid_cells * sizeof(DistTriPair)));
     CUDA_CHECK(cudaMalloc(&d_intersection_count, num_grid_cells * sizeof(int)));
     CUDA_CHECK(cudaMalloc(&d_phi_read, num_grid_cells * sizeof(float)));
@@ -629,16 +953,12 @@ void make_level_set3(const std::vector<Vec3ui> &tri, const std::vector<Vec3f> &x
     CUDA_CHECK(cudaMalloc(&d_closest_tri_read, num_grid_cells * sizeof(int)));
     CUDA_CHECK(cudaMalloc(&d_closest_tri_write, num_grid_cells * sizeof(int)));
 
-    // Host to device copy
-    CUDA_CHECK(cudaMemcpy(d_tri, tri.data(), num_triangles * sizeof(Vec3ui), cudaMemcpyHostToDevice));
-    CUDA_CHECK(cudaMemcpy(d_x, x.data(), num_vertices * sizeof(Vec3f), cudaMemcpyHostToDevice));
-
     // Kernel 1: Initialize
     dim3 blockInit(8, 8, 8);
     dim3 gridInit((ni + 7) / 8, (nj + 7) / 8, (nk + 7) / 8);
     initialize_grids_kernel<<<gridInit, blockInit>>>(d_dist_tri, d_intersection_count, ni, nj, nk, (ni+nj+nk)*dx);
     CUDA_CHECK(cudaGetLastError());
-    CUDA_CHECK(cudaDeviceSynchronize());
+    CUDA_CHECK(cudaStreamSynchronize(cudaStreamPerThread));
 
     // Kernel 2: Near-band distances
     int blockNear = 256;
@@ -646,7 +966,7 @@ void make_level_set3(const std::vector<Vec3ui> &tri, const std::vector<Vec3f> &x
     near_band_distance_kernel<<<gridNear, blockNear>>>(d_tri, d_x, d_dist_tri, d_intersection_count,
                                                        num_triangles, origin, dx, ni, nj, nk, exact_band);
     CUDA_CHECK(cudaGetLastError());
-    CUDA_CHECK(cudaDeviceSynchronize());
+    CUDA_CHECK(cudaStreamSynchronize(cudaStreamPerThread));
 
     // Extract phi and triangle indices from DistTriPair
     CUDA_CHECK(cudaMemcpy2D(d_phi_read, sizeof(float), d_dist_tri, sizeof(DistTriPair),
@@ -679,36 +999,53 @@ void make_level_set3(const std::vector<Vec3ui> &tri, const std::vector<Vec3f> &x
     // }
     // std::cout << std::endl;
 
-    // Kernel 3: Fast sweeping
+    // Kernel 3: Far-field propagation
     dim3 blockSweep(8, 8, 8);
     dim3 gridSweep = gridInit;
 
-    // Jacobi iterations need more passes than Gauss-Seidel sweeps for same convergence
-    // CPU uses 2 passes × 8 directional Gauss-Seidel sweeps = 16 effective sweeps
-    // GPU Jacobi method: Match CPU's effective sweep count but iterate more
-    // to allow information to propagate across the entire gridf
-    const int sweep_iterations = std::max(ni, std::max(nj, nk)) * 2;
-
-    // std::cout << "Fast sweeping: " << sweep_iterations << " Jacobi iterations" << std::endl;
-
-    for (int iter = 0; iter < sweep_iterations; ++iter) {
-        fast_sweep_eikonal_kernel<<<gridSweep, blockSweep>>>(
-            d_phi_read, d_phi_write, dx, ni, nj, nk);
-        CUDA_CHECK(cudaGetLastError());
-        std::swap(d_phi_read, d_phi_write);
-
-        // DEBUG: Check convergence periodically (commented out for production)
-        // if (iter % (sweep_iterations / 4) == (sweep_iterations / 4 - 1) || iter == sweep_iterations - 1) {
-        //     CUDA_CHECK(cudaMemcpy(debug_phi.data(), d_phi_read, num_grid_cells * sizeof(float), cudaMemcpyDeviceToHost));
-        //     float min_val = *std::min_element(debug_phi.begin(), debug_phi.end());
-        //     float max_val = *std::max_element(debug_phi.begin(), debug_phi.end());
-        //     float avg_val = 0.0f;
-        //     for (float v : debug_phi) avg_val += v;
-        //     avg_val /= num_grid_cells;
-        //     std::cout << "  Iteration " << (iter+1) << ": min=" << min_val << ", max=" << max_val << ", avg=" << avg_val << std::endl;
-        // }
+    if (jump_flood) {
+        // Jump flooding: log2(N) passes with step N/2, N/4, ..., 1 instead of
+        // O(N) Jacobi iterations
+        const int max_dim = std::max(ni, std::max(nj, nk));
+        int step = 1;
+        while (step * 2 < max_dim) step *= 2;
+
+        for (; step >= 1; step /= 2) {
+            jump_flood_kernel<<<gridSweep, blockSweep>>>(
+                d_tri, d_x, d_phi_read, d_closest_tri_read, d_phi_write, d_closest_tri_write,
+                step, origin, dx, ni, nj, nk);
+            CUDA_CHECK(cudaGetLastError());
+            std::swap(d_phi_read, d_phi_write);
+            std::swap(d_closest_tri_read, d_closest_tri_write);
+        }
+    } else {
+        // Jacobi iterations need more passes than Gauss-Seidel sweeps for same convergence
+        // CPU uses 2 passes × 8 directional Gauss-Seidel sweeps = 16 effective sweeps
+        // GPU Jacobi method: Match CPU's effective sweep count but iterate more
+        // to allow information to propagate across the entire gridf
+        const int sweep_iterations = std::max(ni, std::max(nj, nk)) * 2;
+
+        // std::cout << "Fast sweeping: " << sweep_iterations << " Jacobi iterations" << std::endl;
+
+        for (int iter = 0; iter < sweep_iterations; ++iter) {
+            fast_sweep_eikonal_kernel<<<gridSweep, blockSweep>>>(
+                d_phi_read, d_phi_write, dx, ni, nj, nk);
+            CUDA_CHECK(cudaGetLastError());
+            std::swap(d_phi_read, d_phi_write);
+
+            // DEBUG: Check convergence periodically (commented out for production)
+            // if (iter % (sweep_iterations / 4) == (sweep_iterations / 4 - 1) || iter == sweep_iterations - 1) {
+            //     CUDA_CHECK(cudaMemcpy(debug_phi.data(), d_phi_read, num_grid_cells * sizeof(float), cudaMemcpyDeviceToHost));
+            //     float min_val = *std::min_element(debug_phi.begin(), debug_phi.end());
+            //     float max_val = *std::max_element(debug_phi.begin(), debug_phi.end());
+            //     float avg_val = 0.0f;
+            //     for (float v : debug_phi) avg_val += v;
+            //     avg_val /= num_grid_cells;
+            //     std::cout << "  Iteration " << (iter+1) << ": min=" << min_val << ", max=" << max_val << ", avg=" << avg_val << std::endl;
+            // }
+        }
     }
-    CUDA_CHECK(cudaDeviceSynchronize());
+    CUDA_CHECK(cudaStreamSynchronize(cudaStreamPerThread));
 
     // DEBUG: Sample values at specific points for comparison (commented out for production)
     // std::cout << "Sample distances before sign correction:" << std::endl;
@@ -741,7 +1078,7 @@ void make_level_set3(const std::vector<Vec3ui> &tri, const std::vector<Vec3f> &x
     dim3 gridSign((nj + 15) / 16, (nk + 15) / 16);
     sign_correction_kernel<<<gridSign, blockSign>>>(d_phi_read, d_intersection_count, ni, nj, nk);
     CUDA_CHECK(cudaGetLastError());
-    CUDA_CHECK(cudaDeviceSynchronize());
+    CUDA_CHECK(cudaStreamSynchronize(cudaStreamPerThread));
 
     // Device to host copy
     phi.resize(ni, nj, nk);
@@ -764,8 +1101,6 @@ void make_level_set3(const std::vector<Vec3ui> &tri, const std::vector<Vec3f> &x
     // std::cout << std::endl;
 
     // Cleanup
-    CUDA_CHECK(cudaFree(d_tri));
-    CUDA_CHECK(cudaFree(d_x));
     CUDA_CHECK(cudaFree(d_dist_tri));
     CUDA_CHECK(cudaFree(d_intersection_count));
     CUDA_CHECK(cudaFree(d_phi_read));
@@ -776,5 +1111,31 @@ void make_level_set3(const std::vector<Vec3ui> &tri, const std::vector<Vec3f> &x
     // std::cout << "GPU SDF computation complete." << std::endl;
 }
 
+void make_level_set3(const Vec3ui *tri, size_t num_triangles,
+                     const Vec3f *x, size_t num_vertices,
+                     const Vec3f &origin, float dx, int ni, int nj, int nk,
+                     Array3f &phi, const int exact_band)
+{
+    make_level_set3_impl(tri, num_triangles, x, num_vertices,
+                         origin, dx, ni, nj, nk, phi, exact_band, false);
+}
+
+void make_level_set3_jfa(const Vec3ui *tri, size_t num_triangles,
+                         const Vec3f *x, size_t num_vertices,
+                         const Vec3f &origin, float dx, int ni, int nj, int nk,
+                         Array3f &phi, const int exact_band)
+{
+    make_level_set3_impl(tri, num_triangles, x, num_vertices,
+                         origin, dx, ni, nj, nk, phi, exact_band, true);
+}
+
+void make_level_set3(const std::vector<Vec3ui> &tri, const std::vector<Vec3f> &x,
+                     const Vec3f &origin, float dx, int ni, int nj, int nk,
+                     Array3f &phi, const int exact_band)
+{
+    make_level_set3(tri.data(), tri.size(), x.data(), x.size(),
+                    origin, dx, ni, nj, nk, phi, exact_band);
+}
+
 } // namespace gpu
 } // namespace sdfgen
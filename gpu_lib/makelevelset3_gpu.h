@@ -6,6 +6,8 @@
 
 #include "array3.h"
 #include "vec.h"
+#include <cstddef>
+#include <vector>
 
 namespace sdfgen {
 namespace gpu {
@@ -36,10 +38,60 @@ namespace gpu {
  * @note Results should be numerically identical or nearly identical to CPU version
  * @note Distances within exact_band cells of triangles are computed exactly
  * @note Distances beyond exact_band may not be to the closest triangle
+ * @note Zero-area triangles (collapsed to a point or segment) are skipped, as on the CPU
  */
 void make_level_set3(const std::vector<Vec3ui> &tri, const std::vector<Vec3f> &x,
                      const Vec3f &origin, float dx, int nx, int ny, int nz,
                      Array3f &phi, const int exact_band=1);
 
+/**
+ * @brief Generate signed distance field on the GPU from caller-owned mesh arrays
+ *
+ * Same as the std::vector overload, but uploads the mesh directly from contiguous arrays
+ * (e.g. NumPy buffers) without an intermediate host copy.
+ *
+ * @param tri Pointer to num_triangles triangle index triples
+ * @param num_triangles Number of triangles
+ * @param x Pointer to num_vertices vertex positions
+ * @param num_vertices Number of vertices
+ */
+void make_level_set3(const Vec3ui *tri, size_t num_triangles,
+                     const Vec3f *x, size_t num_vertices,
+                     const Vec3f &origin, float dx, int nx, int ny, int nz,
+                     Array3f &phi, const int exact_band=1);
+
+/**
+ * @brief Generate signed distance field on the GPU using jump flooding for the far field
+ *
+ * Same near-band seeding and sign determination as make_level_set3(), but instead of
+ * O(N) Jacobi Eikonal iterations the closest-triangle indices seeded in the near band
+ * are spread across the grid with log2(N) jump-flooding passes (step N/2, N/4, ..., 1).
+ * Every far-field cell then stores the exact distance to the closest triangle found by
+ * the flood, which is at least as accurate as the Eikonal estimate and much cheaper on
+ * large grids.
+ *
+ * @param tri Pointer to num_triangles triangle index triples
+ * @param num_triangles Number of triangles
+ * @param x Pointer to num_vertices vertex positions
+ * @param num_vertices Number of vertices
+ *
+ * @note Jump flooding is approximate: a few far-field cells may pick a triangle that is
+ *       slightly farther than the true closest one
+ */
+void make_level_set3_jfa(const Vec3ui *tri, size_t num_triangles,
+                         const Vec3f *x, size_t num_vertices,
+                         const Vec3f &origin, float dx, int nx, int ny, int nz,
+                         Array3f &phi, const int exact_band=1);
+
+/**
+ * @brief Release all meshes held in the device-side mesh cache
+ *
+ * make_level_set3() keeps recently used meshes resident on the GPU (LRU, capped at
+ * 256 MB, keyed by a hash of the full mesh contents and verified against a host copy on
+ * every hit) so repeated calls on the same mesh skip the host-to-device upload. Buffers still in use by a running computation are
+ * freed when that computation finishes.
+ */
+void clear_device_cache();
+
 } // namespace gpu
 } // namespace sdfgen
@@ -13,6 +13,8 @@ Prerequisites:
 
 Running the Examples:
     python basic_usage.py
+    python basic_usage.py --parallel   # run examples 3, 4 and 6 on the CPU in worker processes
+    python basic_usage.py --quiet      # suppress example 1's informational log output
 
 The examples will print detailed output showing:
     - Mesh statistics (vertex/triangle counts, bounding boxes)
@@ -22,9 +24,145 @@ The examples will print detailed output showing:
     - Validation results
 """
 
+import argparse
+import contextlib
+import functools
+import io
+import logging
+import multiprocessing
+import os
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
 import sdfgen
 import numpy as np
 
+logger = logging.getLogger("sdfgen.examples")
+
+
+def _readonly(array):
+    """Mark an example mesh array read-only so it can be shared between calls."""
+    array.flags.writeable = False
+    return array
+
+
+# Example meshes are built once at import and reused by every call, so the
+# examples don't pay for list-to-ndarray conversion each time they run.
+
+# Unit cube centered at the origin (example 3)
+_CUBE_VERTS = _readonly(np.array(
+    [
+        [-0.5, -0.5, -0.5],
+        [0.5, -0.5, -0.5],
+        [0.5, 0.5, -0.5],
+        [-0.5, 0.5, -0.5],
+        [-0.5, -0.5, 0.5],
+        [0.5, -0.5, 0.5],
+        [0.5, 0.5, 0.5],
+        [-0.5, 0.5, 0.5],
+    ],
+    dtype=np.float32,
+))
+
+_CUBE_TRIS = _readonly(np.array(
+    [
+        [0, 1, 2], [0, 2, 3],  # Front
+        [4, 6, 5], [4, 7, 6],  # Back
+        [0, 3, 7], [0, 7, 4],  # Left
+        [1, 5, 6], [1, 6, 2],  # Right
+        [0, 4, 5], [0, 5, 1],  # Bottom
+        [3, 2, 6], [3, 6, 7],  # Top
+    ],
+    dtype=np.uint32,
+))
+
+# Tetrahedron (example 5)
+_TETRAHEDRON_VERTS = _readonly(np.array(
+    [[-1, -1, -1], [1, -1, -1], [0, 1, -1], [0, 0, 1]], dtype=np.float32
+))
+
+_TETRAHEDRON_TRIS = _readonly(np.array(
+    [[0, 1, 2], [0, 1, 3], [1, 2, 3], [2, 0, 3]], dtype=np.uint32
+))
+
+# Octahedron, a simple sphere-like mesh (example 6)
+_OCTAHEDRON_VERTS = _readonly(np.array(
+    [[1, 0, 0], [-1, 0, 0], [0, 1, 0], [0, -1, 0], [0, 0, 1], [0, 0, -1]],
+    dtype=np.float32,
+))
+
+_OCTAHEDRON_TRIS = _readonly(np.array(
+    [
+        [0, 2, 4], [0, 4, 3], [0, 3, 5], [0, 5, 2],
+        [1, 4, 2], [1, 3, 4], [1, 5, 3], [1, 2, 5],
+    ],
+    dtype=np.uint32,
+))
+
+
+def _count_near_surface(sdf, threshold):
+    """
+    Count cells with |sdf| < threshold, one i-slab at a time.
+
+    np.sum(np.abs(sdf) < threshold) allocates two full-grid temporaries;
+    reusing slab-sized scratch buffers keeps the extra memory to a single
+    slab regardless of grid size.
+    """
+    scratch = np.empty(sdf.shape[1:], dtype=sdf.dtype)
+    mask = np.empty(sdf.shape[1:], dtype=bool)
+    count = 0
+    for slab in sdf:
+        np.abs(slab, out=scratch)
+        np.less(scratch, threshold, out=mask)
+        count += int(np.count_nonzero(mask))
+    return count
+
+
+def _minmax(sdf):
+    """
+    Return (sdf.min(), sdf.max()) from a single pass over the grid.
+
+    Both reductions run on the same i-slab while it is still in cache, so
+    the grid is streamed from memory once instead of twice.
+    """
+    lo = np.inf
+    hi = -np.inf
+    for slab in sdf:
+        lo = min(lo, float(slab.min()))
+        hi = max(hi, float(slab.max()))
+    return lo, hi
+
+
+def _max_diff_and_close(a, b, rtol=1e-5, atol=1e-8, need_max=True):
+    """
+    Return (max |a - b|, np.allclose(a, b, rtol, atol)) from a single pass.
+
+    Works one i-slab at a time with reusable scratch buffers, so neither a
+    full-grid difference array nor a second scan for the maximum is needed.
+    Accepts memory-mapped inputs without loading them whole. As with
+    np.allclose and np.max, a NaN in either input is never close and makes
+    the maximum NaN. With need_max=False the scan stops at the first slab
+    that is not close, and the returned maximum covers only the slabs read.
+    """
+    diff = np.empty(a.shape[1:], dtype=np.float32)
+    tol = np.empty(a.shape[1:], dtype=np.float32)
+    max_diff = 0.0
+    close = True
+    for a_slab, b_slab in zip(a, b):
+        np.subtract(a_slab, b_slab, out=diff)
+        np.abs(diff, out=diff)
+        # np.maximum propagates NaN; the builtin max() would drop it
+        max_diff = float(np.maximum(max_diff, diff.max()))
+        np.abs(b_slab, out=tol)
+        tol *= rtol
+        tol += atol
+        # Written as "<=" so NaN differences count as not close
+        close = close and bool(np.all(diff <= tol))
+        if not close and not need_max:
+            break
+    return max_diff, close
+
 
 def example_1_load_and_generate():
     """
@@ -43,38 +181,44 @@ def example_1_load_and_generate():
         - Min/max distance values
         - Backend used (GPU or CPU)
     """
-    print("Example 1: Load mesh and generate SDF")
-    print("=" * 50)
+    # Messages go through the "sdfgen.examples" logger with lazy %-style
+    # arguments, so nothing is formatted when INFO is disabled (--quiet)
+    logger.info("Example 1: Load mesh and generate SDF")
+    logger.info("=" * 50)
 
     # Load a mesh file (OBJ or STL)
     mesh_file = "bunny.obj"  # Replace with your mesh file
 
+    if not os.path.isfile(mesh_file):
+        logger.info("Skipping: %s not found\n", mesh_file)
+        return
+
     try:
         vertices, triangles, bounds = sdfgen.load_mesh(mesh_file)
-        print(f"Loaded mesh: {vertices.shape[0]} vertices, {triangles.shape[0]} triangles")
-        print(f"Bounds: {bounds}")
-
-        # Generate SDF with 64x64x64 grid
-        sdf = sdfgen.generate_sdf(
-            vertices,
-            triangles,
-            origin=bounds[0],
-            dx=0.01,
-            nx=64,
-            ny=64,
-            nz=64,
-            backend="auto",  # Try GPU, fall back to CPU
-        )
+    except sdfgen.MeshLoadError as e:
+        logger.error("Error: %s\n", e)
+        return
 
-        print(f"Generated SDF: {sdf.shape}")
-        print(f"Min distance: {sdf.min():.4f}, Max distance: {sdf.max():.4f}")
-        print(f"Backend used: {sdfgen.get_active_backend()}")
+    logger.info("Loaded mesh: %d vertices, %d triangles", vertices.shape[0], triangles.shape[0])
+    logger.info("Bounds: %s", bounds)
 
-    except Exception as e:
-        print(f"Error: {e}")
-        print("Make sure to replace 'bunny.obj' with a valid mesh file path")
+    # Generate SDF with 64x64x64 grid
+    sdf = sdfgen.generate_sdf(
+        vertices,
+        triangles,
+        origin=bounds[0],
+        dx=0.01,
+        nx=64,
+        ny=64,
+        nz=64,
+        backend="auto",  # Try GPU, fall back to CPU
+    )
 
-    print()
+    # Only scan the grid for statistics if they will actually be shown
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Generated SDF: %s", sdf.shape)
+        logger.info("Min distance: %.4f, Max distance: %.4f", *_minmax(sdf))
+        logger.info("Backend used: %s\n", "gpu" if sdfgen.is_gpu_available() else "cpu")
 
 
 def example_2_high_level_api():
@@ -99,25 +243,33 @@ def example_2_high_level_api():
 
     mesh_file = "dragon.stl"  # Replace with your mesh file
 
+    if not os.path.isfile(mesh_file):
+        print(f"Skipping: {mesh_file} not found")
+        print()
+        return
+
     try:
-        # Generate SDF with automatic grid sizing
+        # Generate SDF with automatic grid sizing. Only the exact_band=2 cell
+        # band around the surface (matching padding=2) is computed; cells
+        # farther away are clamped to +/-2*dx, so the cost follows the
+        # surface area instead of the 256-cell grid volume
         sdf, metadata = sdfgen.generate_from_file(
             mesh_file,
             nx=256,  # Will create proportional grid
             padding=2,
-            backend="auto",
+            exact_band=2,
+            backend="cpu_narrowband",
         )
-
-        print(f"Generated SDF: {sdf.shape}")
-        print(f"Cell size: {metadata['dx']:.6f}")
-        print(f"Origin: {metadata['origin']}")
-        print(f"Bounds: {metadata['bounds']}")
-        print(f"Backend: {metadata['backend']}")
-
-    except Exception as e:
+    except sdfgen.MeshLoadError as e:
         print(f"Error: {e}")
-        print("Make sure to replace 'dragon.stl' with a valid mesh file path")
+        print()
+        return
 
+    print(f"Generated SDF: {sdf.shape}")
+    print(f"Cell size: {metadata['dx']:.6f}")
+    print(f"Origin: {metadata['origin']}")
+    print(f"Bounds: {metadata['bounds']}")
+    print(f"Backend: {metadata['backend']}")
     print()
 
 
@@ -141,66 +293,53 @@ def example_3_programmatic_mesh():
     print("Example 3: Programmatic mesh (cube)")
     print("=" * 50)
 
-    # Create a simple cube mesh
-    vertices = np.array(
-        [
-            [-0.5, -0.5, -0.5],
-            [0.5, -0.5, -0.5],
-            [0.5, 0.5, -0.5],
-            [-0.5, 0.5, -0.5],
-            [-0.5, -0.5, 0.5],
-            [0.5, -0.5, 0.5],
-            [0.5, 0.5, 0.5],
-            [-0.5, 0.5, 0.5],
-        ],
-        dtype=np.float32,
-    )
+    # Size the persistent CPU worker pool once instead of per call; restored
+    # below so later examples keep the default
+    previous_threads = sdfgen.get_num_threads()
+    sdfgen.set_num_threads(4)
 
-    triangles = np.array(
-        [
-            [0, 1, 2], [0, 2, 3],  # Front
-            [4, 6, 5], [4, 7, 6],  # Back
-            [0, 3, 7], [0, 7, 4],  # Left
-            [1, 5, 6], [1, 6, 2],  # Right
-            [0, 4, 5], [0, 5, 1],  # Bottom
-            [3, 2, 6], [3, 6, 7],  # Top
-        ],
-        dtype=np.uint32,
-    )
+    # Use the precomputed cube mesh
+    vertices = _CUBE_VERTS
+    triangles = _CUBE_TRIS
 
     # Generate SDF
-    sdf, metadata = sdfgen.generate_from_mesh(
-        vertices,
-        triangles,
-        nx=32,
-        padding=2,
-        backend="cpu",
-        num_threads=4,
-    )
+    try:
+        sdf, metadata = sdfgen.generate_from_mesh(
+            vertices,
+            triangles,
+            nx=32,
+            padding=2,
+            backend="cpu",
+        )
+    finally:
+        sdfgen.set_num_threads(previous_threads)
 
     print(f"Generated SDF: {sdf.shape}")
     print(f"Cell size: {metadata['dx']:.6f}")
     print(f"Backend: {metadata['backend']}")
 
     # Analyze the SDF
-    center_idx = tuple(s // 2 for s in sdf.shape)
-    center_value = sdf[center_idx]
+    center_value = sdfgen.center_value(sdf)
     print(f"Value at center: {center_value:.6f} (should be negative)")
 
     # Find zero crossing (surface)
-    zero_crossings = np.sum(np.abs(sdf) < 0.01)
+    zero_crossings = _count_near_surface(sdf, 0.01)
     print(f"Cells near surface (|sdf| < 0.01): {zero_crossings}")
 
     print()
 
 
-def example_4_save_and_load():
+def example_4_save_and_load(gpu=True):
     """
     Example 4: Save and load SDF files.
 
     Demonstrates saving an SDF to binary file format and loading it back,
     including metadata preservation and round-trip validation.
 
+    Args:
+        gpu: Let the "auto" backend pick the GPU; False forces the CPU
+            (used when running in a worker process)
+
     Prerequisites:
         - None (creates mesh programmatically)
 
@@ -211,6 +350,7 @@ def example_4_save_and_load():
         - Cell spacing (dx)
         - Bounding box
         - Validation that loaded SDF matches original (checkmark or X)
+        - Size reduction of the int8 narrow-band file ('triangle_int8.sdf')
     """
     print("Example 4: Save and load SDF")
     print("=" * 50)
@@ -230,6 +370,7 @@ def example_4_save_and_load():
         nx=30,
         ny=30,
         nz=30,
+        backend="auto" if gpu else "cpu",
     )
 
     # Save to file
@@ -237,19 +378,31 @@ def example_4_save_and_load():
     sdfgen.save_sdf(output_file, sdf, origin=(-0.5, -0.5, -0.5), dx=0.05)
     print(f"Saved SDF to {output_file}")
 
-    # Load back
-    loaded_sdf, origin, dx, bounds = sdfgen.load_sdf(output_file)
+    # Load back as a memory map so validation does not hold a second
+    # full copy of the grid in RAM
+    loaded_sdf, origin, dx, bounds = sdfgen.load_sdf(output_file, mmap_mode="r")
     print(f"Loaded SDF: {loaded_sdf.shape}")
     print(f"Origin: {origin}")
     print(f"Cell size: {dx}")
     print(f"Bounds: {bounds}")
 
-    # Verify they match
-    if np.allclose(sdf, loaded_sdf):
+    # Verify they match, one i-slab at a time
+    _, matches = _max_diff_and_close(sdf, loaded_sdf, need_max=False)
+    del loaded_sdf  # release the mapping before the file is reused
+
+    if matches:
         print("✓ Loaded SDF matches original")
     else:
         print("✗ Mismatch between original and loaded SDF")
 
+    # Narrow-band int8 storage keeps full resolution only near the surface
+    compact_file = "triangle_int8.sdf"
+    sdfgen.save_sdf(
+        compact_file, sdf, origin=(-0.5, -0.5, -0.5), dx=0.05, dtype="int8_narrowband"
+    )
+    ratio = os.path.getsize(output_file) / os.path.getsize(compact_file)
+    print(f"int8 narrow-band file is {ratio:.1f}x smaller than float32")
+
     print()
 
 
@@ -269,6 +422,8 @@ def example_5_backend_comparison():
         - CPU execution time in seconds
         - GPU execution time in seconds
         - Speedup ratio (typically 10-40x for GPU)
+        - Jump-flooding GPU time and its difference from the CPU result
+        - Wall-clock time of both backends run concurrently
         - Maximum difference between CPU and GPU results
         - Validation that results match within tolerance (checkmark or X)
     """
@@ -284,61 +439,81 @@ def example_5_backend_comparison():
         print()
         return
 
-    # Create test mesh
-    vertices = np.array(
-        [[-1, -1, -1], [1, -1, -1], [0, 1, -1], [0, 0, 1]], dtype=np.float32
-    )
-    triangles = np.array(
-        [[0, 1, 2], [0, 1, 3], [1, 2, 3], [2, 0, 3]], dtype=np.uint32
-    )
+    # Use the precomputed tetrahedron mesh
+    vertices = _TETRAHEDRON_VERTS
+    triangles = _TETRAHEDRON_TRIS
 
     import time
 
-    # CPU benchmark
-    start = time.time()
-    sdf_cpu = sdfgen.generate_sdf(
-        vertices,
-        triangles,
-        origin=(-2, -2, -2),
-        dx=0.02,
-        nx=100,
-        ny=100,
-        nz=100,
-        backend="cpu",
-    )
-    cpu_time = time.time() - start
-
-    # GPU benchmark
-    start = time.time()
-    sdf_gpu = sdfgen.generate_sdf(
-        vertices,
-        triangles,
-        origin=(-2, -2, -2),
-        dx=0.02,
-        nx=100,
-        ny=100,
-        nz=100,
-        backend="gpu",
-    )
-    gpu_time = time.time() - start
+    grid = dict(origin=(-2, -2, -2), dx=0.02, nx=100, ny=100, nz=100)
+
+    # Warm up both backends so one-time costs (CUDA context creation,
+    # thread start-up, page faults) are not attributed to the timed run
+    sdfgen.generate_sdf(vertices, triangles, backend="cpu", **grid)
+    sdfgen.generate_sdf(vertices, triangles, backend="gpu", **grid)
+    sdfgen.generate_sdf(vertices, triangles, backend="gpu_jfa", **grid)
+    sdfgen.cuda_synchronize()
+
+    # CPU benchmark, writing straight into an on-disk .npy instead of a new
+    # in-memory array (the same pattern scales to grids larger than RAM)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        sdf_disk = np.lib.format.open_memmap(
+            os.path.join(tmpdir, "cpu.npy"), mode="w+", dtype=np.float32,
+            shape=(grid["nx"], grid["ny"], grid["nz"]),
+        )
+        start = time.perf_counter_ns()
+        sdfgen.generate_sdf(vertices, triangles, backend="cpu", out=sdf_disk, **grid)
+        cpu_time = (time.perf_counter_ns() - start) / 1e9
+        del sdf_disk
+
+    # GPU benchmark (synchronize so queued kernels are included in the timing)
+    start = time.perf_counter_ns()
+    sdfgen.generate_sdf(vertices, triangles, backend="gpu", **grid)
+    sdfgen.cuda_synchronize()
+    gpu_time = (time.perf_counter_ns() - start) / 1e9
+
+    # Jump-flooding GPU benchmark (log2(N) passes instead of O(N) sweeps)
+    start = time.perf_counter_ns()
+    sdf_jfa = sdfgen.generate_sdf(vertices, triangles, backend="gpu_jfa", **grid)
+    sdfgen.cuda_synchronize()
+    jfa_time = (time.perf_counter_ns() - start) / 1e9
+
+    # Both backends at once from a single mesh upload; these are the
+    # results used for the consistency check below
+    start = time.perf_counter_ns()
+    sdf_cpu, sdf_gpu = sdfgen.generate_sdf_both(vertices, triangles, **grid)
+    sdfgen.cuda_synchronize()
+    both_time = (time.perf_counter_ns() - start) / 1e9
 
     print(f"CPU time: {cpu_time:.3f} seconds")
     print(f"GPU time: {gpu_time:.3f} seconds")
     print(f"Speedup: {cpu_time / gpu_time:.2f}x")
+    print(f"GPU jump-flooding time: {jfa_time:.3f} seconds")
+    print(f"Jump-flooding speedup: {cpu_time / jfa_time:.2f}x")
+    print(f"CPU+GPU concurrent time: {both_time:.3f} seconds")
 
-    # Check consistency
-    max_diff = np.abs(sdf_cpu - sdf_gpu).max()
+    # Check consistency (max difference and tolerance test in one pass)
+    max_diff, close = _max_diff_and_close(sdf_cpu, sdf_gpu, rtol=1e-5)
     print(f"Max difference: {max_diff:.6e}")
 
-    if np.allclose(sdf_cpu, sdf_gpu, rtol=1e-5):
+    if close:
         print("✓ CPU and GPU results match")
     else:
         print("✗ CPU and GPU results differ")
 
+    # Jump flooding stores exact far-field distances, so it is compared against
+    # the CPU sweep with a looser tolerance than the Eikonal GPU backend
+    jfa_diff, jfa_close = _max_diff_and_close(sdf_cpu, sdf_jfa, rtol=0.1, atol=0.05)
+    print(f"Max difference (jump flooding): {jfa_diff:.6e}")
+    if jfa_close:
+        print("✓ CPU and jump-flooding GPU results agree")
+    else:
+        print("✗ CPU and jump-flooding GPU results differ")
+
     print()
 
 
-def example_6_different_resolutions():
+def example_6_different_resolutions(gpu=True):
     """
     Example 6: Generate SDFs at different resolutions.
 
@@ -346,6 +521,10 @@ def example_6_different_resolutions():
     representation quality improves with higher resolution. Useful for
     understanding the resolution-accuracy tradeoff.
 
+    Args:
+        gpu: Use the GPU when one is available; False forces the CPU
+            multires path (used when running in a worker process)
+
     Prerequisites:
         - None (creates mesh programmatically)
 
@@ -358,41 +537,73 @@ def example_6_different_resolutions():
     print("Example 6: Multi-resolution SDF generation")
     print("=" * 50)
 
-    # Create a simple sphere-like mesh (octahedron)
-    vertices = np.array(
-        [[1, 0, 0], [-1, 0, 0], [0, 1, 0], [0, -1, 0], [0, 0, 1], [0, 0, -1]],
-        dtype=np.float32,
-    )
-
-    triangles = np.array(
-        [
-            [0, 2, 4], [0, 4, 3], [0, 3, 5], [0, 5, 2],
-            [1, 4, 2], [1, 3, 4], [1, 5, 3], [1, 2, 5],
-        ],
-        dtype=np.uint32,
-    )
+    # Use the precomputed sphere-like mesh (octahedron)
+    vertices = _OCTAHEDRON_VERTS
+    triangles = _OCTAHEDRON_TRIS
 
     resolutions = [16, 32, 64, 128]
 
-    for res in resolutions:
-        sdf = sdfgen.generate_sdf(
+    if gpu and sdfgen.is_gpu_available():
+        # Small grids underfill the GPU on their own, so launch every level
+        # at once; each runs on its own CUDA stream and they overlap
+        futures = [
+            sdfgen.generate_sdf_async(
+                vertices,
+                triangles,
+                origin=(-2, -2, -2),
+                dx=4.0 / res,
+                nx=res,
+                ny=res,
+                nz=res,
+                backend="gpu",
+            )
+            for res in resolutions
+        ]
+        sdfs = [future.result() for future in futures]
+    else:
+        # One call computes every level over the same 4x4x4 region
+        sdfs = sdfgen.generate_sdf_multires(
             vertices,
             triangles,
             origin=(-2, -2, -2),
-            dx=4.0 / res,
-            nx=res,
-            ny=res,
-            nz=res,
+            extent=4.0,
+            resolutions=resolutions,
         )
 
+    for res, sdf in zip(resolutions, sdfs):
         # Analyze surface quality
-        near_surface = np.sum(np.abs(sdf) < 0.1)
+        near_surface = _count_near_surface(sdf, 0.1)
         print(f"Resolution {res}³: {near_surface} cells near surface")
 
     print()
 
 
+def _run_captured(example):
+    """Run an example in a worker process and return everything it printed."""
+    buffer = io.StringIO()
+    with contextlib.redirect_stdout(buffer):
+        example()
+    return buffer.getvalue()
+
+
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--parallel", action="store_true",
+        help="run the independent CPU examples (3, 4, 6) in parallel processes",
+    )
+    parser.add_argument(
+        "--quiet", action="store_true",
+        help="only log warnings and errors from logger-based examples",
+    )
+    args = parser.parse_args()
+
+    # Log to stdout so logger output stays in order with the print()-based examples
+    logging.basicConfig(
+        stream=sys.stdout, format="%(message)s",
+        level=logging.WARNING if args.quiet else logging.INFO,
+    )
+
     print("SDFGen Python Bindings - Examples")
     print("=" * 50)
     print()
@@ -400,9 +611,31 @@ if __name__ == "__main__":
     # Run examples
     example_1_load_and_generate()
     example_2_high_level_api()
-    example_3_programmatic_mesh()
-    example_4_save_and_load()
-    example_5_backend_comparison()
-    example_6_different_resolutions()
+
+    if args.parallel:
+        # Workers stay on the CPU so the GPU benchmark below has the GPU to itself
+        independent = [
+            example_3_programmatic_mesh,
+            functools.partial(example_4_save_and_load, gpu=False),
+            functools.partial(example_6_different_resolutions, gpu=False),
+        ]
+        # Spawn rather than fork: the parent has already initialized CUDA, which
+        # is unusable in a forked child
+        with ProcessPoolExecutor(
+            max_workers=len(independent), mp_context=multiprocessing.get_context("spawn")
+        ) as executor:
+            futures = [executor.submit(_run_captured, example) for example in independent]
+
+            # The GPU benchmark runs here in the parent so it has the GPU to itself
+            example_5_backend_comparison()
+
+            # Print captured output in example order, not completion order
+            for future in futures:
+                print(future.result(), end="")
+    else:
+        example_3_programmatic_mesh()
+        example_4_save_and_load()
+        example_5_backend_comparison()
+        example_6_different_resolutions()
 
     print("Done!")
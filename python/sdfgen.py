@@ -28,11 +28,22 @@ __license__ = "MIT"
 # Import the compiled extension module
 try:
     from .sdfgen_ext import (
+        MeshLoadError,
+        DegenerateMeshError,
+        GridSpec,
         load_mesh,
-        generate_sdf,
-        save_sdf,
-        load_sdf,
+        generate_sdf as _generate_sdf,
+        generate_sdf_multires as _generate_sdf_multires,
+        generate_sdf_batch as _generate_sdf_batch,
+        generate_sdf_both as _generate_sdf_both,
+        save_sdf as _save_sdf,
+        load_sdf as _load_sdf,
+        center_value,
         is_gpu_available,
+        cuda_synchronize,
+        clear_device_cache,
+        set_num_threads,
+        get_num_threads,
     )
 except ImportError as e:
     raise ImportError(
@@ -40,9 +51,80 @@ except ImportError as e:
         "Make sure the package was built correctly with CMake and nanobind."
     ) from e
 
+import functools
+import threading
+import warnings
+from concurrent.futures import Future, ThreadPoolExecutor
+
 import numpy as np
 from typing import Tuple, Optional, Union
 
+# Worker pool behind generate_sdf_async, created on first use
+_ASYNC_MAX_WORKERS = 4
+_async_executor = None
+_async_executor_lock = threading.Lock()
+
+# .sdf header: dims (3 x int32), bounds_min (3 x float32), bounds_max (3 x float32)
+_SDF_HEADER_DTYPE = np.dtype([("dims", "<i4", 3), ("min", "<f4", 3), ("max", "<f4", 3)])
+
+# Quantized SDF container written by save_sdf(dtype="float16" | "int8_narrowband").
+# Starts with a magic tag (never a valid .sdf dimension) followed by the .sdf fields.
+_QSDF_MAGIC = b"SDFQ"
+_QSDF_VERSION = 1
+_QSDF_HEADER_DTYPE = np.dtype([
+    ("magic", "S4"),
+    ("version", "<u4"),
+    ("encoding", "<u4"),
+    ("dims", "<i4", 3),
+    ("min", "<f4", 3),
+    ("max", "<f4", 3),
+    ("band", "<f4"),
+    ("block", "<u4"),
+])
+_QSDF_ENCODINGS = {"float16": 1, "int8_narrowband": 2}
+
+# int8 narrow-band layout: edge length of occupancy blocks, default band in cells
+_QSDF_BLOCK = 8
+_QSDF_DEFAULT_BAND_CELLS = 3
+_INT8_MAX = 127
+
+
+def _warn_if_copied(array, dtype, name):
+    """Warn when the extension will have to convert ``array`` (a full copy)."""
+    if isinstance(array, np.ndarray) and not (
+        array.dtype == dtype and array.flags.c_contiguous
+    ):
+        warnings.warn(
+            f"converting {name} from {array.dtype} "
+            f"({'C' if array.flags.c_contiguous else 'non-C'}-contiguous) to a "
+            f"C-contiguous {np.dtype(dtype).name} array, copy made",
+            UserWarning,
+            stacklevel=3,
+        )
+
+
+def _check_mesh_arrays(native):
+    """
+    Wrap an extension function taking (vertices, triangles, ...) so that
+    inputs the extension cannot read in place raise a UserWarning.
+
+    float32 / uint32 C-contiguous arrays are passed straight through without
+    a copy; anything else is still converted by the extension as before.
+    """
+    @functools.wraps(native)
+    def wrapper(vertices, triangles, *args, **kwargs):
+        _warn_if_copied(vertices, np.float32, "vertices")
+        _warn_if_copied(triangles, np.uint32, "triangles")
+        return native(vertices, triangles, *args, **kwargs)
+
+    return wrapper
+
+
+generate_sdf = _check_mesh_arrays(_generate_sdf)
+generate_sdf_multires = _check_mesh_arrays(_generate_sdf_multires)
+generate_sdf_batch = _check_mesh_arrays(_generate_sdf_batch)
+generate_sdf_both = _check_mesh_arrays(_generate_sdf_both)
+
 
 def generate_from_mesh(
     vertices: np.ndarray,
@@ -81,7 +163,7 @@ def generate_from_mesh(
     exact_band : int, default=1
         Distance band for exact computation
     backend : str, default="auto"
-        Hardware backend: "auto", "cpu", or "gpu"
+        Hardware backend: "auto", "cpu", "cpu_narrowband", "gpu", or "gpu_jfa"
     num_threads : int, default=0
         Number of CPU threads (0 = auto-detect)
 
@@ -178,7 +260,7 @@ def generate_from_file(
     exact_band : int, default=1
         Distance band for exact computation
     backend : str, default="auto"
-        Hardware backend: "auto", "cpu", or "gpu"
+        Hardware backend: "auto", "cpu", "cpu_narrowband", "gpu", or "gpu_jfa"
     num_threads : int, default=0
         Number of CPU threads (0 = auto-detect)
 
@@ -265,15 +347,390 @@ def generate_from_file(
     return sdf, metadata
 
 
+def _encode_int8_narrowband(sdf: np.ndarray, band: float):
+    """Split a grid into block occupancy bits, per-cell sign bits and int8 blocks."""
+    B = _QSDF_BLOCK
+    ni, nj, nk = sdf.shape
+    bi, bj, bk = -(-ni // B), -(-nj // B), -(-nk // B)
+
+    # Pad to whole blocks with far-field values, then view as (bi, bj, bk, B, B, B)
+    padded = np.full((bi * B, bj * B, bk * B), band, dtype=np.float32)
+    padded[:ni, :nj, :nk] = sdf
+    # NaN cells are stored as code 0, matching generate_sdf(dtype="int8")
+    np.copyto(padded[:ni, :nj, :nk], 0.0, where=np.isnan(sdf))
+    blocks = padded.reshape(bi, B, bj, B, bk, B).transpose(0, 2, 4, 1, 3, 5)
+
+    occupied = (np.abs(blocks) < band).any(axis=(3, 4, 5))
+    scale = np.float32(band / _INT8_MAX)
+    codes = np.clip(np.rint(blocks[occupied] / scale), -_INT8_MAX, _INT8_MAX).astype(np.int8)
+
+    return np.packbits(occupied), np.packbits(sdf < 0), codes
+
+
+def _decode_int8_narrowband(payload: memoryview, shape: Tuple[int, int, int]) -> np.ndarray:
+    """Inverse of _encode_int8_narrowband; returns dense int8 codes (far field = +/-127)."""
+    B = _QSDF_BLOCK
+    ni, nj, nk = shape
+    bi, bj, bk = -(-ni // B), -(-nj // B), -(-nk // B)
+    num_blocks = bi * bj * bk
+    num_cells = ni * nj * nk
+
+    occupancy_bytes = -(-num_blocks // 8)
+    sign_bytes = -(-num_cells // 8)
+    buffer = np.frombuffer(payload, dtype=np.uint8)
+    if buffer.size < occupancy_bytes + sign_bytes:
+        raise ValueError("truncated payload")
+
+    occupied = np.unpackbits(buffer[:occupancy_bytes], count=num_blocks).astype(bool)
+    occupied = occupied.reshape(bi, bj, bk)
+    negative = np.unpackbits(
+        buffer[occupancy_bytes:occupancy_bytes + sign_bytes], count=num_cells
+    ).astype(bool).reshape(ni, nj, nk)
+
+    num_occupied = int(np.count_nonzero(occupied))
+    values = buffer[occupancy_bytes + sign_bytes:].view(np.int8)
+    if values.size != num_occupied * B ** 3:
+        raise ValueError("block data size does not match occupancy mask")
+
+    blocks = np.full((bi, bj, bk, B, B, B), _INT8_MAX, dtype=np.int8)
+    blocks[occupied] = values.reshape(num_occupied, B, B, B)
+    codes = blocks.transpose(0, 3, 1, 4, 2, 5).reshape(bi * B, bj * B, bk * B)
+    codes = np.ascontiguousarray(codes[:ni, :nj, :nk])
+
+    # Cells outside the narrow band only carry their sign
+    codes[negative & (codes == _INT8_MAX)] = -_INT8_MAX
+    return codes
+
+
+def save_sdf(
+    filename: str,
+    sdf_array: np.ndarray,
+    origin: Tuple[float, float, float],
+    dx: float,
+    dtype: str = "float32",
+    band: Optional[float] = None,
+) -> None:
+    """
+    Save SDF to binary file.
+
+    Parameters
+    ----------
+    filename : str
+        Output file path (.sdf)
+    sdf_array : ndarray, shape (nx, ny, nz)
+        Signed distance field (converted to float32 if needed)
+    origin : tuple of float
+        Grid origin (x, y, z)
+    dx : float
+        Grid cell spacing
+    dtype : {"float32", "float16", "int8_narrowband"}, default="float32"
+        Storage precision. "float32" writes the standard .sdf format read by
+        the CLI tools. "float16" halves the file size. "int8_narrowband"
+        stores int8 distances only in 8x8x8 blocks touching the band
+        |sdf| < band, plus one sign bit per cell; values outside the band
+        load back saturated to +/-band and NaN cells load back as 0.
+    band : float, optional
+        Narrow-band half-width in world units for "int8_narrowband"
+        (default: 3 * dx). Quantization step is band / 127.
+    """
+    if dtype == "float32":
+        _save_sdf(filename, sdf_array, origin, dx)
+        return
+
+    if dtype not in _QSDF_ENCODINGS:
+        raise ValueError(
+            f"Invalid dtype: {dtype!r} (expected 'float32', 'float16' or 'int8_narrowband')"
+        )
+
+    sdf = np.ascontiguousarray(sdf_array, dtype=np.float32)
+    if sdf.ndim != 3:
+        raise ValueError("SDF array must be 3-dimensional")
+    if 0 in sdf.shape:
+        raise ValueError("SDF array dimensions cannot be zero")
+
+    if dtype == "int8_narrowband":
+        band = _QSDF_DEFAULT_BAND_CELLS * dx if band is None else band
+        if not band > 0:
+            raise ValueError("Narrow band must be positive")
+    else:
+        band = 0.0
+
+    # Same float32 bounds arithmetic as the native writer
+    min_box = np.asarray(origin, dtype=np.float32)
+    max_box = min_box + np.asarray(sdf.shape, dtype=np.float32) * np.float32(dx)
+
+    header = np.zeros(1, dtype=_QSDF_HEADER_DTYPE)
+    header["magic"] = _QSDF_MAGIC
+    header["version"] = _QSDF_VERSION
+    header["encoding"] = _QSDF_ENCODINGS[dtype]
+    header["dims"] = sdf.shape
+    header["min"] = min_box
+    header["max"] = max_box
+    header["band"] = band
+    header["block"] = _QSDF_BLOCK
+
+    if dtype == "float16":
+        payload = [sdf.astype("<f2")]
+    else:
+        payload = list(_encode_int8_narrowband(sdf, np.float32(band)))
+
+    try:
+        with open(filename, "wb") as f:
+            f.write(header.tobytes())
+            for part in payload:
+                f.write(part.tobytes())
+    except OSError as e:
+        raise RuntimeError(f"Failed to write SDF file: {filename}") from e
+
+
+def _load_quantized_sdf(
+    filename: str, mmap_mode: Optional[str], dequantize: bool
+) -> Tuple[np.ndarray, tuple, float, tuple]:
+    """load_sdf() for files written with dtype="float16" or "int8_narrowband"."""
+    try:
+        header = np.fromfile(filename, dtype=_QSDF_HEADER_DTYPE, count=1)
+    except OSError as e:
+        raise RuntimeError(f"Failed to read SDF file: {filename}") from e
+    if (
+        header.size != 1
+        or header["version"][0] != _QSDF_VERSION
+        or header["block"][0] != _QSDF_BLOCK
+        or header["encoding"][0] not in _QSDF_ENCODINGS.values()
+    ):
+        raise RuntimeError(f"Failed to read SDF file: {filename}")
+
+    shape = tuple(int(n) for n in header["dims"][0])
+    if min(shape) <= 0:
+        raise RuntimeError(f"Failed to read SDF file: {filename}")
+
+    encoding = int(header["encoding"][0])
+    offset = _QSDF_HEADER_DTYPE.itemsize
+    is_float16 = encoding == _QSDF_ENCODINGS["float16"]
+
+    if mmap_mode is not None and not (is_float16 and not dequantize):
+        raise ValueError(
+            "mmap_mode is only supported for float32 files and for float16 files "
+            "with dequantize=False"
+        )
+
+    try:
+        if mmap_mode is not None:
+            sdf = np.memmap(filename, dtype="<f2", mode=mmap_mode, offset=offset, shape=shape)
+        elif is_float16:
+            sdf = np.fromfile(filename, dtype="<f2", offset=offset).reshape(shape)
+            if dequantize:
+                sdf = sdf.astype(np.float32)
+        else:
+            with open(filename, "rb") as f:
+                f.seek(offset)
+                sdf = _decode_int8_narrowband(memoryview(f.read()), shape)
+            if dequantize:
+                sdf = sdf.astype(np.float32)
+                sdf *= np.float32(header["band"][0] / _INT8_MAX)
+    except ValueError as e:
+        # Payload shorter or longer than the header describes
+        raise RuntimeError(f"Failed to read SDF file: {filename}") from e
+
+    min_box = header["min"][0]
+    max_box = header["max"][0]
+    dx = float((max_box[0] - min_box[0]) / np.float32(shape[0]))
+    origin = tuple(float(v) for v in min_box)
+    bounds = (origin, tuple(float(v) for v in max_box))
+
+    return sdf, origin, dx, bounds
+
+
+def load_sdf(
+    filename: str, mmap_mode: Optional[str] = None, dequantize: bool = True
+) -> Tuple[np.ndarray, tuple, float, tuple]:
+    """
+    Load SDF from binary file.
+
+    The grid payload is stored in C-order directly after a fixed 36-byte
+    header, so with ``mmap_mode`` set the array is memory-mapped instead of
+    read into RAM. Large grids can then be inspected or compared slab by slab
+    without materializing a second copy.
+
+    Parameters
+    ----------
+    filename : str
+        Input file path (.sdf)
+    mmap_mode : {None, "r", "r+", "c"}, default=None
+        If None, read the whole grid into a new array. Otherwise return a
+        ``numpy.memmap`` opened with this mode (see ``numpy.memmap``).
+        Supported for float32 files, and for float16 files when
+        ``dequantize=False``.
+    dequantize : bool, default=True
+        For files saved with a reduced ``dtype`` (see :func:`save_sdf`),
+        return float32 distances. If False, return the stored values:
+        float16 distances, or int8 codes for "int8_narrowband" (distance =
+        code * band / 127, with +/-127 meaning outside the band).
+
+    Returns
+    -------
+    sdf : ndarray or memmap, shape (nx, ny, nz)
+        Signed distance field (float32 unless ``dequantize=False``)
+    origin : tuple of float
+        Grid origin (x, y, z)
+    dx : float
+        Grid cell spacing
+    bounds : tuple
+        ((min_x, min_y, min_z), (max_x, max_y, max_z))
+    """
+    if mmap_mode is not None and mmap_mode not in ("r", "r+", "c"):
+        raise ValueError(f"Invalid mmap_mode: {mmap_mode!r} (expected 'r', 'r+' or 'c')")
+
+    try:
+        with open(filename, "rb") as f:
+            quantized = f.read(len(_QSDF_MAGIC)) == _QSDF_MAGIC
+    except OSError:
+        quantized = False  # let the readers below report the failure
+    if quantized:
+        return _load_quantized_sdf(filename, mmap_mode, dequantize)
+
+    if mmap_mode is None:
+        return _load_sdf(filename)
+
+    try:
+        header = np.fromfile(filename, dtype=_SDF_HEADER_DTYPE, count=1)
+    except OSError as e:
+        raise RuntimeError(f"Failed to read SDF file: {filename}") from e
+    if header.size != 1:
+        raise RuntimeError(f"Failed to read SDF file: {filename}")
+
+    ni, nj, nk = (int(n) for n in header["dims"][0])
+    if ni <= 0 or nj <= 0 or nk <= 0:
+        raise RuntimeError(f"Failed to read SDF file: {filename}")
+
+    try:
+        sdf = np.memmap(
+            filename,
+            dtype="<f4",
+            mode=mmap_mode,
+            offset=_SDF_HEADER_DTYPE.itemsize,
+            shape=(ni, nj, nk),
+        )
+    except ValueError as e:
+        # File shorter than the header claims
+        raise RuntimeError(f"Failed to read SDF file: {filename}") from e
+
+    min_box = header["min"][0]
+    max_box = header["max"][0]
+    # Same float32 arithmetic as the native reader
+    dx = float((max_box[0] - min_box[0]) / np.float32(ni))
+    origin = tuple(float(v) for v in min_box)
+    bounds = (origin, tuple(float(v) for v in max_box))
+
+    return sdf, origin, dx, bounds
+
+
+def generate_sdf_async(*args, **kwargs) -> Future:
+    """
+    Start an SDF generation in the background and return a Future.
+
+    Accepts exactly the same arguments as :func:`generate_sdf`. The native
+    call releases the GIL while the grid is computed, so several calls can
+    run at once; on the GPU backend each worker thread submits to its own
+    CUDA stream, which lets small grids overlap on the device instead of
+    running back to back.
+
+    Returns
+    -------
+    future : concurrent.futures.Future
+        Resolves to the ndarray returned by :func:`generate_sdf`, or raises
+        the same exception it would.
+
+    Examples
+    --------
+    >>> futures = [
+    ...     sdfgen.generate_sdf_async(vertices, triangles, origin, 4.0 / n, n, n, n)
+    ...     for n in (16, 32, 64)
+    ... ]
+    >>> sdfs = [f.result() for f in futures]
+    """
+    global _async_executor
+    with _async_executor_lock:
+        if _async_executor is None:
+            _async_executor = ThreadPoolExecutor(
+                max_workers=_ASYNC_MAX_WORKERS, thread_name_prefix="sdfgen"
+            )
+        return _async_executor.submit(generate_sdf, *args, **kwargs)
+
+
+def generate_sdf_into(
+    out: np.ndarray,
+    vertices: np.ndarray,
+    triangles: np.ndarray,
+    origin: Tuple[float, float, float],
+    dx: float,
+    nx: Optional[int] = None,
+    ny: Optional[int] = None,
+    nz: Optional[int] = None,
+    **kwargs,
+) -> np.ndarray:
+    """
+    Generate an SDF into a caller-owned buffer.
+
+    Same as ``generate_sdf(..., out=out)``, with the grid dimensions taken
+    from ``out.shape`` when they are not given. Reusing one buffer across
+    many calls (e.g. a pipeline stage or a shared-memory block) avoids
+    allocating a new output array each time.
+
+    Parameters
+    ----------
+    out : ndarray, shape (nx, ny, nz), dtype float32
+        Writable C-contiguous array that receives the result (int8 with
+        ``dtype="int8"``)
+    vertices, triangles, origin, dx :
+        As for :func:`generate_sdf`
+    nx, ny, nz : int, optional
+        Grid dimensions (default: ``out.shape``); must match ``out.shape``
+    **kwargs :
+        Any other :func:`generate_sdf` keyword (``exact_band``, ``backend``,
+        ``num_threads``, ``accumulate_dtype``, ``dtype``, ``band``)
+
+    Returns
+    -------
+    out : ndarray
+        The ``out`` argument, filled in place
+
+    Raises
+    ------
+    ValueError
+        If ``out`` is not a writable C-contiguous float32 array of shape
+        (nx, ny, nz), or for any reason :func:`generate_sdf` would
+    """
+    shape = np.shape(out)
+    if len(shape) != 3:
+        raise ValueError("out must be a writable C-contiguous float32 array of shape (nx, ny, nz)")
+    nx = shape[0] if nx is None else nx
+    ny = shape[1] if ny is None else ny
+    nz = shape[2] if nz is None else nz
+    return generate_sdf(vertices, triangles, origin, dx, nx, ny, nz, out=out, **kwargs)
+
+
 # Export public API
 __all__ = [
     # Core functions from C++ extension
+    "MeshLoadError",
+    "DegenerateMeshError",
+    "GridSpec",
     "load_mesh",
     "generate_sdf",
+    "generate_sdf_multires",
+    "generate_sdf_batch",
+    "generate_sdf_both",
     "save_sdf",
     "load_sdf",
+    "center_value",
     "is_gpu_available",
+    "cuda_synchronize",
+    "clear_device_cache",
+    "set_num_threads",
+    "get_num_threads",
     # High-level Python convenience functions
+    "generate_sdf_async",
+    "generate_sdf_into",
     "generate_from_mesh",
     "generate_from_file",
 ]
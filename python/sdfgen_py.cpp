@@ -8,6 +8,16 @@
 #include <nanobind/stl/vector.h>
 #include <nanobind/stl/tuple.h>
 
+#include <cmath>
+#include <cstring>
+#include <new>
+#include <stdexcept>
+#include <utility>
+
+#if defined(__linux__)
+#include <sys/mman.h>
+#endif
+
 #include "../common/sdfgen_unified.h"
 #include "../common/mesh_io.h"
 #include "../common/sdf_io.h"
@@ -18,64 +28,98 @@ namespace nb = nanobind;
 using namespace nb::literals;
 
 /**
- * @brief Convert NumPy array of float32 vertices to C++ vector
+ * @brief Raised by load_mesh when a mesh file cannot be opened or parsed
  *
- * Converts Nx3 NumPy array (contiguous, float32) to std::vector<Vec3f> for passing
- * vertex data from Python to C++ SDF generation functions.
+ * Exposed to Python as sdfgen.MeshLoadError, a RuntimeError subclass, so callers can
+ * handle bad mesh files without catching unrelated errors.
+ */
+class MeshLoadError : public std::runtime_error {
+public:
+    using std::runtime_error::runtime_error;
+};
+
+/**
+ * @brief Raised by the generate functions when no triangle of the mesh has any area
  *
- * @param arr NumPy ndarray with shape (N, 3) and dtype float32, C-contiguous
- * @return std::vector containing N Vec3f vertex positions
+ * Exposed to Python as sdfgen.DegenerateMeshError, a ValueError subclass. A mesh whose
+ * triangles all collapse to points or segments has no surface to measure distance to,
+ * so its SDF would be meaningless rather than merely inaccurate.
  */
-std::vector<Vec3f> numpy_to_vec3f(nb::ndarray<float, nb::shape<-1, 3>, nb::c_contig> arr) {
-    size_t n = arr.shape(0);
-    std::vector<Vec3f> result(n);
+class DegenerateMeshError : public std::invalid_argument {
+public:
+    using std::invalid_argument::invalid_argument;
+};
 
-    auto data = arr.data();
-    for (size_t i = 0; i < n; ++i) {
-        result[i] = Vec3f(data[i * 3 + 0], data[i * 3 + 1], data[i * 3 + 2]);
-    }
+// Mesh data is shared with (N, 3) NumPy arrays as flat memory
+static_assert(sizeof(Vec3f) == 3 * sizeof(float), "Vec3f must be tightly packed");
+static_assert(sizeof(Vec3ui) == 3 * sizeof(uint32_t), "Vec3ui must be tightly packed");
 
-    return result;
+/**
+ * @brief View a NumPy array of float32 vertices as Vec3f data
+ *
+ * Reinterprets an Nx3 C-contiguous float32 array in place so vertex data can be passed to
+ * the C++ SDF generation functions without copying. The shape and contiguity constraints
+ * are enforced by the ndarray type, and the layout by the static_asserts above.
+ *
+ * @param arr NumPy ndarray with shape (N, 3) and dtype float32, C-contiguous
+ * @return Pointer to N Vec3f vertex positions, valid while arr is alive
+ */
+const Vec3f* numpy_as_vec3f(const nb::ndarray<const float, nb::shape<-1, 3>, nb::c_contig>& arr) {
+    return reinterpret_cast<const Vec3f*>(arr.data());
 }
 
 /**
- * @brief Convert NumPy array of uint32 triangle indices to C++ vector
+ * @brief View a NumPy array of uint32 triangle indices as Vec3ui data
  *
- * Converts Mx3 NumPy array (contiguous, uint32) to std::vector<Vec3ui> for passing
- * triangle index data from Python to C++ SDF generation functions.
+ * Reinterprets an Mx3 C-contiguous uint32 array in place so triangle index data can be
+ * passed to the C++ SDF generation functions without copying.
  *
  * @param arr NumPy ndarray with shape (M, 3) and dtype uint32, C-contiguous
- * @return std::vector containing M Vec3ui triangle index triples
+ * @return Pointer to M Vec3ui triangle index triples, valid while arr is alive
  */
-std::vector<Vec3ui> numpy_to_vec3ui(nb::ndarray<uint32_t, nb::shape<-1, 3>, nb::c_contig> arr) {
-    size_t n = arr.shape(0);
-    std::vector<Vec3ui> result(n);
+const Vec3ui* numpy_as_vec3ui(const nb::ndarray<const uint32_t, nb::shape<-1, 3>, nb::c_contig>& arr) {
+    return reinterpret_cast<const Vec3ui*>(arr.data());
+}
 
-    auto data = arr.data();
-    for (size_t i = 0; i < n; ++i) {
-        result[i] = Vec3ui(data[i * 3 + 0], data[i * 3 + 1], data[i * 3 + 2]);
+/**
+ * @brief Validate triangle indices and reject meshes without any surface area
+ *
+ * Runs before the GIL is released so bad input is reported as a Python exception instead
+ * of reading past the vertex buffer or producing a meaningless field. Individual
+ * zero-area triangles are allowed as long as at least one triangle has area.
+ *
+ * @throws std::invalid_argument if a triangle references a vertex past num_vertices
+ * @throws DegenerateMeshError if every triangle has zero area
+ */
+void check_mesh(const Vec3ui* tri, size_t num_triangles, const Vec3f* x, size_t num_vertices) {
+    bool has_area = false;
+    for (size_t t = 0; t < num_triangles; ++t) {
+        const Vec3ui& f = tri[t];
+        if (f[0] >= num_vertices || f[1] >= num_vertices || f[2] >= num_vertices) {
+            throw std::invalid_argument("Triangle " + std::to_string(t) +
+                                        " references a vertex index out of range");
+        }
+        if (!has_area) {
+            has_area = mag2(cross(x[f[1]] - x[f[0]], x[f[2]] - x[f[0]])) > 0.0f;
+        }
     }
 
-    return result;
+    if (!has_area) {
+        throw DegenerateMeshError("Mesh is degenerate: every triangle has zero area");
+    }
 }
 
 /**
- * @brief Convert C++ Array3f SDF grid to NumPy array
- *
- * Copies 3D SDF grid data from internal Array3f format to NumPy ndarray with shape
- * (ni, nj, nk) and dtype float32. Returns ownership to Python for memory management.
+ * @brief Copy an Array3f SDF grid into a C-order (ni, nj, nk) float buffer
  *
  * @param arr Input Array3f signed distance field with dimensions ni x nj x nk
- * @return NumPy ndarray with shape (ni, nj, nk), dtype float32, C-contiguous
+ * @param data Destination buffer of ni * nj * nk floats, C-contiguous
  */
-nb::ndarray<nb::numpy, float> array3f_to_numpy(const Array3f& arr) {
+void array3f_copy_to(const Array3f& arr, float* data) {
     size_t ni = arr.ni;
     size_t nj = arr.nj;
     size_t nk = arr.nk;
 
-    // Create numpy array with shape (ni, nj, nk)
-    float* data = new float[ni * nj * nk];
-
     // Copy data from Array3f (i, j, k indexing)
     for (size_t i = 0; i < ni; ++i) {
         for (size_t j = 0; j < nj; ++j) {
@@ -84,29 +128,247 @@ nb::ndarray<nb::numpy, float> array3f_to_numpy(const Array3f& arr) {
             }
         }
     }
+}
 
-    // Create capsule for memory management
-    nb::capsule owner(data, [](void* p) noexcept {
-        delete[] static_cast<float*>(p);
+// Returned SDF grids start on an AVX2 vector boundary and are padded to a whole number
+// of vectors, so SIMD consumers can use aligned loads without a masked tail
+constexpr size_t OUTPUT_ALIGNMENT = 32;                             // Bytes
+
+// Transparent huge page size on x86-64 and most aarch64 kernels
+constexpr size_t HUGEPAGE_SIZE = size_t(2) << 20;                   // Bytes
+
+/**
+ * @brief Map anonymous memory for an output array and ask for transparent huge pages
+ *
+ * The mapping is rounded up to whole huge pages. madvise(MADV_HUGEPAGE) is only a hint:
+ * with THP disabled the buffer is still valid, just backed by normal pages.
+ *
+ * @param bytes Minimum buffer size
+ * @param owner Set to a capsule that unmaps the buffer
+ * @return Start of the mapping (page aligned), or nullptr if it is not supported here
+ */
+char* map_hugepage_buffer(size_t bytes, nb::capsule& owner) {
+#if defined(__linux__) && defined(MADV_HUGEPAGE)
+    size_t length = (bytes + HUGEPAGE_SIZE - 1) / HUGEPAGE_SIZE * HUGEPAGE_SIZE;
+    void* p = mmap(nullptr, length, PROT_READ | PROT_WRITE, MAP_PRIVATE | MAP_ANONYMOUS, -1, 0);
+    if (p == MAP_FAILED) {
+        return nullptr;
+    }
+    madvise(p, length, MADV_HUGEPAGE);
+
+    owner = nb::capsule(new std::pair<void*, size_t>(p, length), [](void* m) noexcept {
+        auto* mapping = static_cast<std::pair<void*, size_t>*>(m);
+        munmap(mapping->first, mapping->second);
+        delete mapping;
     });
+    return static_cast<char*>(p);
+#else
+    (void)bytes;
+    (void)owner;
+    return nullptr;
+#endif
+}
+
+/**
+ * @brief Allocate an OUTPUT_ALIGNMENT-aligned C-order (ni, nj, nk) NumPy array
+ *
+ * The bytes past the last element, up to a multiple of OUTPUT_ALIGNMENT, are zeroed.
+ *
+ * @param ni, nj, nk Array dimensions
+ * @param data Set to the start of the (uninitialized) element storage
+ * @param use_hugepages Back the buffer with a huge-page mapping where supported (Linux),
+ *        falling back to the normal allocator otherwise
+ * @return NumPy ndarray owning the buffer
+ */
+template<class T>
+nb::ndarray<nb::numpy, T> aligned_numpy_array(size_t ni, size_t nj, size_t nk, T*& data,
+                                              bool use_hugepages = false) {
+    size_t bytes = ni * nj * nk * sizeof(T);
+    size_t padded = (bytes + OUTPUT_ALIGNMENT - 1) / OUTPUT_ALIGNMENT * OUTPUT_ALIGNMENT;
+
+    nb::capsule owner;
+    char* buffer = (use_hugepages && padded > 0) ? map_hugepage_buffer(padded, owner) : nullptr;
+    if (buffer == nullptr) {
+        buffer = static_cast<char*>(
+            ::operator new[](padded, std::align_val_t(OUTPUT_ALIGNMENT)));
+
+        // Create capsule for memory management
+        owner = nb::capsule(buffer, [](void* p) noexcept {
+            ::operator delete[](p, std::align_val_t(OUTPUT_ALIGNMENT));
+        });
+    }
+    std::memset(buffer + bytes, 0, padded - bytes);
+    data = reinterpret_cast<T*>(buffer);
+
+    return nb::ndarray<nb::numpy, T>(data, {ni, nj, nk}, owner);
+}
+
+/**
+ * @brief Convert C++ Array3f SDF grid to NumPy array
+ *
+ * Copies 3D SDF grid data from internal Array3f format to NumPy ndarray with shape
+ * (ni, nj, nk) and dtype float32. Returns ownership to Python for memory management.
+ * The buffer is OUTPUT_ALIGNMENT-byte aligned and zero-padded past the last element up
+ * to a multiple of OUTPUT_ALIGNMENT bytes.
+ *
+ * @param arr Input Array3f signed distance field with dimensions ni x nj x nk
+ * @param use_hugepages Allocate the result in huge pages (see aligned_numpy_array())
+ * @return NumPy ndarray with shape (ni, nj, nk), dtype float32, C-contiguous
+ */
+nb::ndarray<nb::numpy, float> array3f_to_numpy(const Array3f& arr, bool use_hugepages = false) {
+    float* data;
+    auto result = aligned_numpy_array(arr.ni, arr.nj, arr.nk, data, use_hugepages);
+    array3f_copy_to(arr, data);
+    return result;
+}
+
+// int8 output of generate_sdf(dtype="int8"): distances in steps of band / 127, the same
+// codes as the "int8_narrowband" .sdf encoding, saturated to +/-127 outside the band
+constexpr int INT8_CODE_MAX = 127;
+constexpr float DEFAULT_BAND_CELLS = 3.0f;                          // Default band, in dx
 
-    size_t shape[3] = {ni, nj, nk};
+/**
+ * @brief Quantize an Array3f SDF grid into a C-order (ni, nj, nk) int8 buffer
+ *
+ * Each cell becomes round(phi / (band / 127)) clamped to [-127, 127], rounding half to
+ * even. NaN cells (if any) become 0.
+ *
+ * @param arr Input Array3f signed distance field with dimensions ni x nj x nk
+ * @param band Distance represented by code +/-127, in world units
+ * @param data Destination buffer of ni * nj * nk int8 values, C-contiguous
+ */
+void array3f_quantize_to(const Array3f& arr, float band, int8_t* data) {
+    size_t nj = arr.nj;
+    size_t nk = arr.nk;
+    float scale = band / INT8_CODE_MAX;
+
+    for (size_t i = 0; i < (size_t)arr.ni; ++i) {
+        for (size_t j = 0; j < nj; ++j) {
+            for (size_t k = 0; k < nk; ++k) {
+                float phi = arr(i, j, k);
+                // fmin/fmax would return the non-NaN operand, saturating NaN to +127
+                float code = std::isnan(phi) ? 0.0f : std::nearbyint(phi / scale);
+                code = std::fmax(std::fmin(code, (float)INT8_CODE_MAX), (float)-INT8_CODE_MAX);
+                data[i * nj * nk + j * nk + k] = (int8_t)code;
+            }
+        }
+    }
+}
+
+/**
+ * @brief Quantize an Array3f SDF grid into a new int8 NumPy array
+ *
+ * Same buffer alignment and padding as array3f_to_numpy().
+ *
+ * @param arr Input Array3f signed distance field with dimensions ni x nj x nk
+ * @param band Distance represented by code +/-127, in world units
+ * @param use_hugepages Allocate the result in huge pages (see aligned_numpy_array())
+ * @return NumPy ndarray with shape (ni, nj, nk), dtype int8, C-contiguous
+ */
+nb::ndarray<nb::numpy, int8_t> array3f_to_int8_numpy(const Array3f& arr, float band,
+                                                     bool use_hugepages = false) {
+    int8_t* data;
+    auto result = aligned_numpy_array(arr.ni, arr.nj, arr.nk, data, use_hugepages);
+    array3f_quantize_to(arr, band, data);
+    return result;
+}
 
-    return nb::ndarray<nb::numpy, float>(
-        data, {ni, nj, nk}, owner
+/**
+ * @brief Convert a Python (x, y, z) tuple to Vec3f
+ *
+ * @param t Python tuple with at least three numeric entries
+ * @return Vec3f with the first three entries cast to float
+ */
+Vec3f tuple_to_vec3f(const nb::tuple& t) {
+    return Vec3f(
+        nb::cast<float>(t[0]),
+        nb::cast<float>(t[1]),
+        nb::cast<float>(t[2])
     );
 }
 
+/**
+ * @brief Build a GridSpec from Python grid parameters, validating them
+ *
+ * @param origin Grid origin (x, y, z)
+ * @param dx Cell spacing
+ * @param nx, ny, nz Grid dimensions
+ * @return GridSpec holding the converted values
+ * A zero dimension is allowed and describes an empty grid.
+ *
+ * @throws std::invalid_argument if origin is not a 3-tuple, a dimension is negative, or
+ *         dx is not positive and finite
+ */
+sdfgen::GridSpec make_grid_spec(const nb::tuple& origin, float dx, int nx, int ny, int nz) {
+    if (origin.size() != 3) {
+        throw std::invalid_argument("origin must be an (x, y, z) tuple");
+    }
+
+    if (nx < 0 || ny < 0 || nz < 0) {
+        throw std::invalid_argument("Grid dimensions must be non-negative (nx, ny, nz >= 0)");
+    }
+
+    // Written so NaN fails too
+    if (!(dx > 0.0f) || !std::isfinite(dx)) {
+        throw std::invalid_argument("Cell spacing dx must be positive and finite");
+    }
+
+    sdfgen::GridSpec spec;
+    spec.origin = tuple_to_vec3f(origin);
+    spec.dx = dx;
+    spec.nx = nx;
+    spec.ny = ny;
+    spec.nz = nz;
+    return spec;
+}
+
+/**
+ * @brief Parse a backend name into a HardwareBackend value
+ *
+ * @param backend One of "auto", "cpu", "cpu_narrowband", "gpu", or "gpu_jfa"
+ * @return Matching sdfgen::HardwareBackend
+ * @throws std::invalid_argument if the name is not recognized
+ */
+sdfgen::HardwareBackend parse_backend(const std::string& backend) {
+    if (backend == "auto") {
+        return sdfgen::HardwareBackend::Auto;
+    } else if (backend == "cpu") {
+        return sdfgen::HardwareBackend::CPU;
+    } else if (backend == "cpu_narrowband") {
+        return sdfgen::HardwareBackend::CPU_NARROWBAND;
+    } else if (backend == "gpu") {
+        return sdfgen::HardwareBackend::GPU;
+    } else if (backend == "gpu_jfa") {
+        return sdfgen::HardwareBackend::GPU_JFA;
+    }
+    throw std::invalid_argument("Invalid backend: " + backend + " (must be 'auto', 'cpu', 'cpu_narrowband', 'gpu', or 'gpu_jfa')");
+}
+
 // Load mesh from file
 nb::tuple load_mesh(const std::string& filename) {
     std::vector<Vec3f> vertices;
     std::vector<Vec3ui> triangles;
     Vec3f min_box, max_box;
 
-    bool success = meshio::load_mesh(filename.c_str(), vertices, triangles, min_box, max_box);
+    bool success;
+    std::string parse_error;
+    {
+        nb::gil_scoped_release release;
+        try {
+            success = meshio::load_mesh(filename.c_str(), vertices, triangles, min_box, max_box);
+        } catch (const std::logic_error& e) {
+            // Malformed face indices (std::invalid_argument / std::out_of_range)
+            success = false;
+            parse_error = e.what();
+        }
+    }
 
     if (!success) {
-        throw std::runtime_error("Failed to load mesh: " + filename);
+        std::string message = "Failed to load mesh: " + filename;
+        if (!parse_error.empty()) {
+            message += " (" + parse_error + ")";
+        }
+        throw MeshLoadError(message);
     }
 
     // Convert to numpy arrays
@@ -115,11 +377,7 @@ nb::tuple load_mesh(const std::string& filename) {
 
     // Vertices array (nv, 3)
     float* vert_data = new float[nv * 3];
-    for (size_t i = 0; i < nv; ++i) {
-        vert_data[i * 3 + 0] = vertices[i][0];
-        vert_data[i * 3 + 1] = vertices[i][1];
-        vert_data[i * 3 + 2] = vertices[i][2];
-    }
+    std::memcpy(vert_data, vertices.data(), nv * sizeof(Vec3f));
 
     nb::capsule vert_owner(vert_data, [](void* p) noexcept {
         delete[] static_cast<float*>(p);
@@ -132,11 +390,7 @@ nb::tuple load_mesh(const std::string& filename) {
 
     // Triangles array (nt, 3)
     uint32_t* tri_data = new uint32_t[nt * 3];
-    for (size_t i = 0; i < nt; ++i) {
-        tri_data[i * 3 + 0] = triangles[i][0];
-        tri_data[i * 3 + 1] = triangles[i][1];
-        tri_data[i * 3 + 2] = triangles[i][2];
-    }
+    std::memcpy(tri_data, triangles.data(), nt * sizeof(Vec3ui));
 
     nb::capsule tri_owner(tri_data, [](void* p) noexcept {
         delete[] static_cast<uint32_t*>(p);
@@ -156,71 +410,347 @@ nb::tuple load_mesh(const std::string& filename) {
     return nb::make_tuple(vert_array, tri_array, bounds);
 }
 
+// Writable output grids accepted by generate_sdf(out=...)
+using OutputArray = nb::ndarray<float, nb::ndim<3>, nb::c_contig, nb::device::cpu>;
+using OutputArrayInt8 = nb::ndarray<int8_t, nb::ndim<3>, nb::c_contig, nb::device::cpu>;
+
+// Cast out to the array type T if it is one with shape (nx, ny, nz), without converting it
+template<class T>
+bool cast_output_array(const nb::object& out, int nx, int ny, int nz, T& array) {
+    return nb::try_cast(out, array, false) &&
+           array.shape(0) == (size_t)nx && array.shape(1) == (size_t)ny &&
+           array.shape(2) == (size_t)nz;
+}
+
+// Generate SDF from numpy arrays on a grid described by a GridSpec
+nb::object generate_sdf_on_grid(
+    nb::ndarray<const float, nb::shape<-1, 3>, nb::c_contig> vertices,
+    nb::ndarray<const uint32_t, nb::shape<-1, 3>, nb::c_contig> triangles,
+    const sdfgen::GridSpec& grid,
+    int exact_band = 1,
+    const std::string& backend = "auto",
+    int num_threads = 0,
+    nb::object out = nb::none(),
+    const std::string& accumulate_dtype = "float32",
+    const std::string& dtype = "float32",
+    nb::object band = nb::none(),
+    bool use_hugepages = false
+) {
+    bool accumulate_double;
+    if (accumulate_dtype == "float32") {
+        accumulate_double = false;
+    } else if (accumulate_dtype == "float64") {
+        accumulate_double = true;
+    } else {
+        throw std::invalid_argument("Invalid accumulate_dtype: '" + accumulate_dtype +
+                                    "' (expected 'float32' or 'float64')");
+    }
+
+    bool quantize;
+    if (dtype == "float32") {
+        quantize = false;
+    } else if (dtype == "int8") {
+        quantize = true;
+    } else {
+        throw std::invalid_argument("Invalid dtype: '" + dtype +
+                                    "' (expected 'float32' or 'int8')");
+    }
+
+    // Only used by dtype='int8', like save_sdf's band
+    float band_width = DEFAULT_BAND_CELLS * grid.dx;
+    if (quantize && !band.is_none()) {
+        band_width = nb::cast<float>(band);
+        if (!(band_width > 0.0f) || !std::isfinite(band_width)) {
+            throw std::invalid_argument("band must be positive and finite");
+        }
+    }
+
+    // Validate the output buffer without converting it: writing into an implicit
+    // copy would silently lose the result
+    OutputArray out_array;
+    OutputArrayInt8 out_array_int8;
+    if (!out.is_none()) {
+        if (quantize ? !cast_output_array(out, grid.nx, grid.ny, grid.nz, out_array_int8)
+                     : !cast_output_array(out, grid.nx, grid.ny, grid.nz, out_array)) {
+            throw std::invalid_argument("out must be a writable C-contiguous " + dtype +
+                                        " array of shape (nx, ny, nz)");
+        }
+    }
+
+    sdfgen::HardwareBackend hw_backend = parse_backend(backend);
+
+    // A grid with no cells (e.g. clipped away by the caller) needs nothing from the mesh
+    if (grid.nx == 0 || grid.ny == 0 || grid.nz == 0) {
+        if (!out.is_none()) {
+            return out;
+        }
+        Array3f empty(grid.nx, grid.ny, grid.nz);
+        if (quantize) {
+            return nb::cast(array3f_to_int8_numpy(empty, band_width));
+        }
+        return nb::cast(array3f_to_numpy(empty));
+    }
+
+    // Validate mesh is not empty
+    if (vertices.shape(0) == 0 || triangles.shape(0) == 0) {
+        throw std::invalid_argument("Cannot generate SDF from empty mesh (vertices or triangles are empty)");
+    }
+
+    // Read the mesh straight out of the NumPy buffers (no copy)
+    const Vec3f* verts = numpy_as_vec3f(vertices);
+    const Vec3ui* tris = numpy_as_vec3ui(triangles);
+    check_mesh(tris, triangles.shape(0), verts, vertices.shape(0));
+
+    // Generate SDF (the ndarray arguments keep the buffers alive, so other
+    // Python threads can run while the grid is computed)
+    Array3f phi;
+    {
+        nb::gil_scoped_release release;
+        sdfgen::make_level_set3(
+            tris, triangles.shape(0),
+            verts, vertices.shape(0),
+            grid.origin, grid.dx,
+            grid.nx, grid.ny, grid.nz,
+            phi,
+            exact_band,
+            hw_backend,
+            num_threads,
+            accumulate_double
+        );
+
+        // Fill the caller's buffer (e.g. an np.memmap) in place
+        if (!out.is_none()) {
+            if (quantize) {
+                array3f_quantize_to(phi, band_width, out_array_int8.data());
+            } else {
+                array3f_copy_to(phi, out_array.data());
+            }
+        }
+    }
+
+    if (!out.is_none()) {
+        return out;
+    }
+
+    // Convert to numpy
+    if (quantize) {
+        return nb::cast(array3f_to_int8_numpy(phi, band_width, use_hugepages));
+    }
+    return nb::cast(array3f_to_numpy(phi, use_hugepages));
+}
+
 // Generate SDF from numpy arrays
-nb::ndarray<nb::numpy, float> generate_sdf(
-    nb::ndarray<float, nb::shape<-1, 3>, nb::c_contig> vertices,
-    nb::ndarray<uint32_t, nb::shape<-1, 3>, nb::c_contig> triangles,
+nb::object generate_sdf(
+    nb::ndarray<const float, nb::shape<-1, 3>, nb::c_contig> vertices,
+    nb::ndarray<const uint32_t, nb::shape<-1, 3>, nb::c_contig> triangles,
     nb::tuple origin,
     float dx,
     int nx, int ny, int nz,
     int exact_band = 1,
     const std::string& backend = "auto",
+    int num_threads = 0,
+    nb::object out = nb::none(),
+    const std::string& accumulate_dtype = "float32",
+    const std::string& dtype = "float32",
+    nb::object band = nb::none(),
+    bool use_hugepages = false
+) {
+    return generate_sdf_on_grid(
+        vertices, triangles, make_grid_spec(origin, dx, nx, ny, nz),
+        exact_band, backend, num_threads, out, accumulate_dtype, dtype, band, use_hugepages
+    );
+}
+
+// Generate SDFs of one mesh at several cubic resolutions
+nb::list generate_sdf_multires(
+    nb::ndarray<const float, nb::shape<-1, 3>, nb::c_contig> vertices,
+    nb::ndarray<const uint32_t, nb::shape<-1, 3>, nb::c_contig> triangles,
+    nb::tuple origin,
+    float extent,
+    const std::vector<int>& resolutions,
+    int exact_band = 1,
+    const std::string& backend = "auto",
+    int num_threads = 0
+) {
+    if (vertices.shape(0) == 0 || triangles.shape(0) == 0) {
+        throw std::invalid_argument("Cannot generate SDF from empty mesh (vertices or triangles are empty)");
+    }
+
+    if (resolutions.empty()) {
+        throw std::invalid_argument("At least one resolution is required");
+    }
+
+    for (int n : resolutions) {
+        if (n <= 0) {
+            throw std::invalid_argument("Resolutions must be positive");
+        }
+    }
+
+    if (!(extent > 0.0f) || !std::isfinite(extent)) {
+        throw std::invalid_argument("Grid extent must be positive and finite");
+    }
+
+    // Every level reads the mesh straight out of the NumPy buffers (no copy)
+    const Vec3f* verts = numpy_as_vec3f(vertices);
+    const Vec3ui* tris = numpy_as_vec3ui(triangles);
+    check_mesh(tris, triangles.shape(0), verts, vertices.shape(0));
+
+    Vec3f origin_vec = tuple_to_vec3f(origin);
+    sdfgen::HardwareBackend hw_backend = parse_backend(backend);
+
+    std::vector<Array3f> phis;
+    {
+        nb::gil_scoped_release release;
+        sdfgen::make_level_set3_multires(
+            tris, triangles.shape(0),
+            verts, vertices.shape(0),
+            origin_vec, extent,
+            resolutions,
+            phis,
+            exact_band,
+            hw_backend,
+            num_threads
+        );
+    }
+
+    nb::list result;
+    for (const Array3f& phi : phis) {
+        result.append(array3f_to_numpy(phi));
+    }
+    return result;
+}
+
+// Generate SDFs of one mesh on several independent grids
+nb::list generate_sdf_batch(
+    nb::ndarray<const float, nb::shape<-1, 3>, nb::c_contig> vertices,
+    nb::ndarray<const uint32_t, nb::shape<-1, 3>, nb::c_contig> triangles,
+    const std::vector<nb::object>& grids,
+    int exact_band = 1,
+    const std::string& backend = "auto",
+    int num_threads = 0
+) {
+    if (vertices.shape(0) == 0 || triangles.shape(0) == 0) {
+        throw std::invalid_argument("Cannot generate SDF from empty mesh (vertices or triangles are empty)");
+    }
+
+    if (grids.empty()) {
+        throw std::invalid_argument("At least one grid is required");
+    }
+
+    // Unpack every grid before releasing the GIL; GridSpec objects were validated when
+    // they were constructed and are copied without any further conversion
+    std::vector<sdfgen::GridSpec> specs;
+    specs.reserve(grids.size());
+    for (const nb::object& grid : grids) {
+        if (nb::isinstance<sdfgen::GridSpec>(grid)) {
+            specs.push_back(nb::cast<const sdfgen::GridSpec&>(grid));
+            continue;
+        }
+
+        nb::tuple params;
+        if (!nb::try_cast(grid, params) || params.size() != 5) {
+            throw std::invalid_argument(
+                "Each grid must be a GridSpec or an (origin, dx, nx, ny, nz) tuple");
+        }
+
+        specs.push_back(make_grid_spec(
+            nb::cast<nb::tuple>(params[0]), nb::cast<float>(params[1]),
+            nb::cast<int>(params[2]), nb::cast<int>(params[3]), nb::cast<int>(params[4])
+        ));
+    }
+
+    // Every grid reads the mesh straight out of the NumPy buffers (no copy)
+    const Vec3f* verts = numpy_as_vec3f(vertices);
+    const Vec3ui* tris = numpy_as_vec3ui(triangles);
+    check_mesh(tris, triangles.shape(0), verts, vertices.shape(0));
+
+    sdfgen::HardwareBackend hw_backend = parse_backend(backend);
+
+    // Grids with no cells come back as empty arrays without going through the backend
+    std::vector<sdfgen::GridSpec> nonempty;
+    for (const sdfgen::GridSpec& spec : specs) {
+        if (spec.nx > 0 && spec.ny > 0 && spec.nz > 0) {
+            nonempty.push_back(spec);
+        }
+    }
+
+    std::vector<Array3f> phis;
+    if (!nonempty.empty()) {
+        nb::gil_scoped_release release;
+        sdfgen::make_level_set3_batch(
+            tris, triangles.shape(0),
+            verts, vertices.shape(0),
+            nonempty,
+            phis,
+            exact_band,
+            hw_backend,
+            num_threads
+        );
+    }
+
+    nb::list result;
+    size_t next = 0;
+    for (const sdfgen::GridSpec& spec : specs) {
+        if (spec.nx > 0 && spec.ny > 0 && spec.nz > 0) {
+            result.append(array3f_to_numpy(phis[next++]));
+        } else {
+            result.append(array3f_to_numpy(Array3f(spec.nx, spec.ny, spec.nz)));
+        }
+    }
+    return result;
+}
+
+// Generate the same SDF on CPU and GPU concurrently
+nb::tuple generate_sdf_both(
+    nb::ndarray<const float, nb::shape<-1, 3>, nb::c_contig> vertices,
+    nb::ndarray<const uint32_t, nb::shape<-1, 3>, nb::c_contig> triangles,
+    nb::tuple origin,
+    float dx,
+    int nx, int ny, int nz,
+    int exact_band = 1,
     int num_threads = 0
 ) {
-    // Validate mesh is not empty
     if (vertices.shape(0) == 0 || triangles.shape(0) == 0) {
         throw std::invalid_argument("Cannot generate SDF from empty mesh (vertices or triangles are empty)");
     }
 
-    // Validate grid parameters
     if (nx <= 0 || ny <= 0 || nz <= 0) {
         throw std::invalid_argument("Grid dimensions must be positive (nx, ny, nz > 0)");
     }
 
-    if (dx <= 0.0f) {
-        throw std::invalid_argument("Cell spacing dx must be positive");
+    // Written so NaN fails too
+    if (!(dx > 0.0f) || !std::isfinite(dx)) {
+        throw std::invalid_argument("Cell spacing dx must be positive and finite");
     }
 
-    // Convert inputs
-    auto verts = numpy_to_vec3f(vertices);
-    auto tris = numpy_to_vec3ui(triangles);
+    // Both backends read the mesh straight out of the NumPy buffers (no copy)
+    const Vec3f* verts = numpy_as_vec3f(vertices);
+    const Vec3ui* tris = numpy_as_vec3ui(triangles);
+    check_mesh(tris, triangles.shape(0), verts, vertices.shape(0));
 
-    Vec3f origin_vec(
-        nb::cast<float>(origin[0]),
-        nb::cast<float>(origin[1]),
-        nb::cast<float>(origin[2])
-    );
+    Vec3f origin_vec = tuple_to_vec3f(origin);
 
-    // Parse backend
-    sdfgen::HardwareBackend hw_backend = sdfgen::HardwareBackend::Auto;
-    if (backend == "cpu") {
-        hw_backend = sdfgen::HardwareBackend::CPU;
-    } else if (backend == "gpu") {
-        hw_backend = sdfgen::HardwareBackend::GPU;
-    } else if (backend != "auto") {
-        throw std::invalid_argument("Invalid backend: " + backend + " (must be 'auto', 'cpu', or 'gpu')");
+    Array3f phi_cpu, phi_gpu;
+    {
+        nb::gil_scoped_release release;
+        sdfgen::make_level_set3_both(
+            tris, triangles.shape(0),
+            verts, vertices.shape(0),
+            origin_vec, dx,
+            nx, ny, nz,
+            phi_cpu, phi_gpu,
+            exact_band,
+            num_threads
+        );
     }
 
-    // Generate SDF
-    Array3f phi;
-    sdfgen::make_level_set3(
-        tris, verts,
-        origin_vec, dx,
-        nx, ny, nz,
-        phi,
-        exact_band,
-        hw_backend,
-        num_threads
-    );
-
-    // Convert to numpy
-    return array3f_to_numpy(phi);
+    return nb::make_tuple(array3f_to_numpy(phi_cpu), array3f_to_numpy(phi_gpu));
 }
 
 // Save SDF to binary file
 void save_sdf(
     const std::string& filename,
-    nb::ndarray<float, nb::shape<-1, -1, -1>, nb::c_contig> sdf_array,
+    nb::ndarray<const float, nb::shape<-1, -1, -1>, nb::c_contig> sdf_array,
     nb::tuple origin,
     float dx
 ) {
@@ -250,11 +780,7 @@ void save_sdf(
         }
     }
 
-    Vec3f origin_vec(
-        nb::cast<float>(origin[0]),
-        nb::cast<float>(origin[1]),
-        nb::cast<float>(origin[2])
-    );
+    Vec3f origin_vec = tuple_to_vec3f(origin);
 
     // Compute bounds
     Vec3f max_box(
@@ -307,15 +833,84 @@ nb::tuple load_sdf(const std::string& filename) {
     return nb::make_tuple(sdf_array, origin, dx, bounds);
 }
 
+// Read the value at the grid center (index shape // 2 on every axis)
+float center_value(nb::ndarray<const float, nb::ndim<3>, nb::device::cpu> sdf) {
+    if (sdf.shape(0) == 0 || sdf.shape(1) == 0 || sdf.shape(2) == 0) {
+        throw std::invalid_argument("SDF array dimensions cannot be zero");
+    }
+
+    // Strided view: works on slices and Fortran-order arrays without a copy
+    auto v = sdf.view();
+    return v(v.shape(0) / 2, v.shape(1) / 2, v.shape(2) / 2);
+}
+
 // Query GPU availability
 bool is_gpu_available() {
     return sdfgen::is_gpu_available();
 }
 
+// Wait for outstanding GPU work
+void cuda_synchronize() {
+    sdfgen::cuda_synchronize();
+}
+
+// Free meshes cached on the GPU
+void clear_device_cache() {
+    sdfgen::clear_device_cache();
+}
+
+// Default CPU thread count for calls with num_threads=0
+void set_num_threads(int num_threads) {
+    sdfgen::set_num_threads(num_threads);
+}
+
+int get_num_threads() {
+    return sdfgen::get_num_threads();
+}
+
 // Module definition
 NB_MODULE(sdfgen_ext, m) {
     m.doc() = "Python bindings for SDFGenFast - GPU-accelerated signed distance field generation";
 
+    nb::exception<MeshLoadError>(m, "MeshLoadError", PyExc_RuntimeError);
+    nb::exception<DegenerateMeshError>(m, "DegenerateMeshError", PyExc_ValueError);
+
+    nb::class_<sdfgen::GridSpec>(m, "GridSpec",
+        "Placement and resolution of one SDF grid\n\n"
+        "Holds the origin, dx and (nx, ny, nz) arguments of generate_sdf as plain C\n"
+        "values, validated once when the GridSpec is created. Pass it to\n"
+        "generate_sdf in place of those arguments, or in the grids list of\n"
+        "generate_sdf_batch, to reuse a grid without converting its parameters on\n"
+        "every call.\n\n"
+        "Parameters\n"
+        "----------\n"
+        "origin : tuple of float\n"
+        "    Grid origin (x, y, z) in world space\n"
+        "dx : float\n"
+        "    Grid cell spacing (positive and finite)\n"
+        "shape : tuple of int\n"
+        "    Grid dimensions (nx, ny, nz), all non-negative (0 for an empty grid)")
+        .def("__init__", [](sdfgen::GridSpec* self, nb::tuple origin, float dx, nb::tuple shape) {
+            if (shape.size() != 3) {
+                throw std::invalid_argument("shape must be an (nx, ny, nz) tuple");
+            }
+            new (self) sdfgen::GridSpec(make_grid_spec(
+                origin, dx,
+                nb::cast<int>(shape[0]), nb::cast<int>(shape[1]), nb::cast<int>(shape[2])
+            ));
+        }, "origin"_a, "dx"_a, "shape"_a)
+        .def_prop_ro("origin", [](const sdfgen::GridSpec& g) {
+            return nb::make_tuple(g.origin[0], g.origin[1], g.origin[2]);
+        }, "Grid origin (x, y, z)")
+        .def_ro("dx", &sdfgen::GridSpec::dx, "Grid cell spacing")
+        .def_prop_ro("shape", [](const sdfgen::GridSpec& g) {
+            return nb::make_tuple(g.nx, g.ny, g.nz);
+        }, "Grid dimensions (nx, ny, nz)")
+        .def("__repr__", [](const sdfgen::GridSpec& g) {
+            nb::str fmt("GridSpec(origin=({:.7g}, {:.7g}, {:.7g}), dx={:.7g}, shape=({}, {}, {}))");
+            return fmt.format(g.origin[0], g.origin[1], g.origin[2], g.dx, g.nx, g.ny, g.nz);
+        });
+
     // Core functions
     m.def("load_mesh", &load_mesh,
         "filename"_a,
@@ -331,7 +926,11 @@ NB_MODULE(sdfgen_ext, m) {
         "triangles : ndarray, shape (M, 3), dtype uint32\n"
         "    Triangle indices\n"
         "bounds : tuple\n"
-        "    ((min_x, min_y, min_z), (max_x, max_y, max_z))"
+        "    ((min_x, min_y, min_z), (max_x, max_y, max_z))\n\n"
+        "Raises\n"
+        "------\n"
+        "MeshLoadError\n"
+        "    If the file cannot be opened or parsed (subclass of RuntimeError)"
     );
 
     m.def("generate_sdf", &generate_sdf,
@@ -341,6 +940,11 @@ NB_MODULE(sdfgen_ext, m) {
         "exact_band"_a = 1,
         "backend"_a = "auto",
         "num_threads"_a = 0,
+        "out"_a = nb::none(),
+        "accumulate_dtype"_a = "float32",
+        "dtype"_a = "float32",
+        "band"_a = nb::none(),
+        "use_hugepages"_a = false,
         "Generate a signed distance field from a triangle mesh\n\n"
         "Parameters\n"
         "----------\n"
@@ -353,17 +957,174 @@ NB_MODULE(sdfgen_ext, m) {
         "dx : float\n"
         "    Grid cell spacing\n"
         "nx, ny, nz : int\n"
-        "    Grid dimensions\n"
+        "    Grid dimensions; if any is 0 an empty array is returned without\n"
+        "    reading the mesh\n"
         "exact_band : int, optional\n"
         "    Distance band for exact computation (default: 1)\n"
         "backend : str, optional\n"
-        "    Hardware backend: 'auto', 'cpu', or 'gpu' (default: 'auto')\n"
+        "    Hardware backend: 'auto', 'cpu', 'cpu_narrowband', 'gpu', or 'gpu_jfa'\n"
+        "    (default: 'auto'). 'cpu_narrowband' computes only cells within\n"
+        "    exact_band cells of the surface and clamps the rest to +/-exact_band*dx;\n"
+        "    'gpu_jfa' runs on the GPU with jump-flooding far-field propagation\n"
         "num_threads : int, optional\n"
-        "    Number of CPU threads, 0 for auto-detect (default: 0)\n\n"
+        "    Number of CPU threads, 0 for the set_num_threads() default (default: 0)\n"
+        "out : ndarray, optional\n"
+        "    Writable C-contiguous float32 array of shape (nx, ny, nz), e.g. an\n"
+        "    np.memmap or np.lib.format.open_memmap, to write the result into\n"
+        "    instead of allocating a new array\n"
+        "accumulate_dtype : {'float32', 'float64'}, optional\n"
+        "    Precision of grid positions and point-triangle distances (default:\n"
+        "    'float32'). 'float64' keeps meshes far from the origin accurate at\n"
+        "    the cost of slower CPU arithmetic; the result is float32 either way.\n"
+        "    CPU backends only ('auto' then runs on the CPU)\n"
+        "dtype : {'float32', 'int8'}, optional\n"
+        "    Output type (default: 'float32'). 'int8' stores round(sdf / (band / 127))\n"
+        "    saturated to +/-127, a quarter of the memory of float32; decode with\n"
+        "    ``codes * (band / 127)``\n"
+        "band : float, optional\n"
+        "    Distance mapped to code +/-127 for dtype='int8' (default: 3 * dx)\n"
+        "use_hugepages : bool, optional\n"
+        "    Allocate the returned array in memory advised for transparent huge\n"
+        "    pages (Linux; rounded up to 2 MiB), which cuts TLB misses when large\n"
+        "    grids are traversed later. Elsewhere, or with ``out``, it has no\n"
+        "    effect; the values are the same either way (default: False)\n\n"
         "Returns\n"
         "-------\n"
-        "sdf : ndarray, shape (nx, ny, nz), dtype float32\n"
-        "    Signed distance field (negative inside, positive outside, zero on surface)"
+        "sdf : ndarray, shape (nx, ny, nz), dtype float32 or int8\n"
+        "    Signed distance field (negative inside, positive outside, zero on surface);\n"
+        "    this is ``out`` when it was given\n\n"
+        "Raises\n"
+        "------\n"
+        "DegenerateMeshError\n"
+        "    If every triangle has zero area (subclass of ValueError)\n"
+        "ValueError\n"
+        "    If the mesh is empty, a triangle index is out of range, or the grid\n"
+        "    parameters or ``out`` are invalid"
+    );
+
+    m.def("generate_sdf", &generate_sdf_on_grid,
+        "vertices"_a, "triangles"_a,
+        "grid"_a,
+        "exact_band"_a = 1,
+        "backend"_a = "auto",
+        "num_threads"_a = 0,
+        "out"_a = nb::none(),
+        "accumulate_dtype"_a = "float32",
+        "dtype"_a = "float32",
+        "band"_a = nb::none(),
+        "use_hugepages"_a = false,
+        "Generate a signed distance field on the grid described by a GridSpec\n\n"
+        "Same as generate_sdf(vertices, triangles, origin, dx, nx, ny, nz, ...) with\n"
+        "those values taken from grid"
+    );
+
+    m.def("generate_sdf_multires", &generate_sdf_multires,
+        "vertices"_a, "triangles"_a,
+        "origin"_a, "extent"_a,
+        "resolutions"_a,
+        "exact_band"_a = 1,
+        "backend"_a = "auto",
+        "num_threads"_a = 0,
+        "Generate signed distance fields of one mesh at several resolutions\n\n"
+        "Every level covers the same cubic region [origin, origin + extent]^3 and\n"
+        "uses dx = extent / resolution. The mesh is converted and the backend is\n"
+        "resolved once for all levels.\n\n"
+        "Parameters\n"
+        "----------\n"
+        "vertices : ndarray, shape (N, 3), dtype float32\n"
+        "    Vertex positions\n"
+        "triangles : ndarray, shape (M, 3), dtype uint32\n"
+        "    Triangle indices (zero-based)\n"
+        "origin : tuple of float\n"
+        "    Grid origin (x, y, z) in world space\n"
+        "extent : float\n"
+        "    Edge length of the cubic region covered by every grid\n"
+        "resolutions : list of int\n"
+        "    Cells per axis for each level\n"
+        "exact_band : int, optional\n"
+        "    Distance band for exact computation (default: 1)\n"
+        "backend : str, optional\n"
+        "    Hardware backend: 'auto', 'cpu', 'cpu_narrowband', 'gpu', or 'gpu_jfa'\n"
+        "    (default: 'auto'). 'cpu_narrowband' computes only cells within\n"
+        "    exact_band cells of the surface and clamps the rest to +/-exact_band*dx;\n"
+        "    'gpu_jfa' runs on the GPU with jump-flooding far-field propagation\n"
+        "num_threads : int, optional\n"
+        "    Number of CPU threads, 0 for the set_num_threads() default (default: 0)\n\n"
+        "Returns\n"
+        "-------\n"
+        "sdfs : list of ndarray\n"
+        "    One float32 array of shape (n, n, n) per entry in resolutions"
+    );
+
+    m.def("generate_sdf_batch", &generate_sdf_batch,
+        "vertices"_a, "triangles"_a,
+        "grids"_a,
+        "exact_band"_a = 1,
+        "backend"_a = "auto",
+        "num_threads"_a = 0,
+        "Generate signed distance fields of one mesh on several grids\n\n"
+        "Equivalent to one generate_sdf call per grid, but the mesh is converted\n"
+        "and the backend is resolved once for the whole batch, and the GIL is\n"
+        "released for all of it.\n\n"
+        "Parameters\n"
+        "----------\n"
+        "vertices : ndarray, shape (N, 3), dtype float32\n"
+        "    Vertex positions\n"
+        "triangles : ndarray, shape (M, 3), dtype uint32\n"
+        "    Triangle indices (zero-based)\n"
+        "grids : list of GridSpec or tuple\n"
+        "    One GridSpec, or (origin, dx, nx, ny, nz) tuple with the same meaning\n"
+        "    as the generate_sdf arguments of those names, per grid\n"
+        "exact_band : int, optional\n"
+        "    Distance band for exact computation (default: 1)\n"
+        "backend : str, optional\n"
+        "    Hardware backend: 'auto', 'cpu', 'cpu_narrowband', 'gpu', or 'gpu_jfa'\n"
+        "    (default: 'auto')\n"
+        "num_threads : int, optional\n"
+        "    Number of CPU threads, 0 for the set_num_threads() default (default: 0)\n\n"
+        "Returns\n"
+        "-------\n"
+        "sdfs : list of ndarray\n"
+        "    One float32 array of shape (nx, ny, nz) per grid"
+    );
+
+    m.def("generate_sdf_both", &generate_sdf_both,
+        "vertices"_a, "triangles"_a,
+        "origin"_a, "dx"_a,
+        "nx"_a, "ny"_a, "nz"_a,
+        "exact_band"_a = 1,
+        "num_threads"_a = 0,
+        "Generate the same signed distance field on CPU and GPU concurrently\n\n"
+        "The GPU computation runs on a worker thread while the CPU computation\n"
+        "runs on the calling thread, sharing a single host copy of the mesh.\n"
+        "Useful for validating one backend against the other in roughly\n"
+        "max(cpu_time, gpu_time) wall-clock time.\n\n"
+        "Parameters\n"
+        "----------\n"
+        "vertices : ndarray, shape (N, 3), dtype float32\n"
+        "    Vertex positions\n"
+        "triangles : ndarray, shape (M, 3), dtype uint32\n"
+        "    Triangle indices (zero-based)\n"
+        "origin : tuple of float\n"
+        "    Grid origin (x, y, z) in world space\n"
+        "dx : float\n"
+        "    Grid cell spacing\n"
+        "nx, ny, nz : int\n"
+        "    Grid dimensions\n"
+        "exact_band : int, optional\n"
+        "    Distance band for exact computation (default: 1)\n"
+        "num_threads : int, optional\n"
+        "    Number of CPU threads, 0 for the set_num_threads() default (default: 0)\n\n"
+        "Returns\n"
+        "-------\n"
+        "sdf_cpu : ndarray, shape (nx, ny, nz), dtype float32\n"
+        "    Result of the CPU backend\n"
+        "sdf_gpu : ndarray, shape (nx, ny, nz), dtype float32\n"
+        "    Result of the GPU backend\n\n"
+        "Raises\n"
+        "------\n"
+        "RuntimeError\n"
+        "    If no CUDA-capable GPU is available"
     );
 
     m.def("save_sdf", &save_sdf,
@@ -408,4 +1169,48 @@ NB_MODULE(sdfgen_ext, m) {
         "bool\n"
         "    True if GPU is available, False otherwise"
     );
+
+    m.def("center_value", &center_value,
+        "sdf"_a,
+        "Return the SDF value at the grid center\n\n"
+        "Equivalent to sdf[nx // 2, ny // 2, nz // 2], read directly from the\n"
+        "array buffer (any strides, no copy for float32 input).\n\n"
+        "Parameters\n"
+        "----------\n"
+        "sdf : ndarray\n"
+        "    3D signed distance field\n\n"
+        "Returns\n"
+        "-------\n"
+        "value : float\n"
+        "    Value at the center cell"
+    );
+
+    m.def("cuda_synchronize", &cuda_synchronize,
+        "Block until all outstanding GPU work has completed\n\n"
+        "Call before stopping a timer around GPU work so the measurement\n"
+        "includes kernel completion. No-op when CUDA is unavailable."
+    );
+
+    m.def("clear_device_cache", &clear_device_cache,
+        "Free meshes cached on the GPU between calls\n\n"
+        "The GPU backend keeps recently used meshes resident on the device\n"
+        "(LRU, up to 256 MB, keyed by mesh contents) so repeated SDFs of the\n"
+        "same mesh skip the host-to-device upload. No-op when CUDA is unavailable."
+    );
+
+    m.def("set_num_threads", &set_num_threads,
+        "num_threads"_a,
+        "Set the default number of CPU threads\n\n"
+        "Applies to every CPU computation called with num_threads=0. The CPU\n"
+        "backend reuses one persistent worker pool across calls; this also\n"
+        "starts its workers up front.\n\n"
+        "Parameters\n"
+        "----------\n"
+        "num_threads : int\n"
+        "    Thread count, 0 to auto-detect from the hardware"
+    );
+
+    m.def("get_num_threads", &get_num_threads,
+        "Return the CPU thread count used for calls with num_threads=0"
+    );
 }
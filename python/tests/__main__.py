@@ -0,0 +1,12 @@
+"""
+Run the sdfgen test suite: ``python python/tests [pytest args]``
+
+Extra arguments are passed to pytest, e.g. ``python python/tests -m slow``.
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.exit(pytest.main([os.path.dirname(os.path.abspath(__file__)), "-v", *sys.argv[1:]]))
@@ -7,7 +7,65 @@ the sdfgen package created by the build process.
 import sys
 from pathlib import Path
 
+import pytest
+
 # Add project root to Python path so 'sdfgen' package can be imported
 # The build process creates sdfgen/ at the project root
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_configure(config):
+    config.addinivalue_line("markers", "slow: expensive SDF grids, excluded by default")
+
+    # Benchmarked tests call their function once (like plain tests) unless timing is
+    # requested with --benchmark-enable; runs before pytest-benchmark reads the option
+    if config.pluginmanager.hasplugin("benchmark"):
+        config.option.benchmark_disable = True
+
+
+try:
+    import pytest_benchmark  # noqa: F401  (provides the benchmark fixture)
+except ImportError:
+    @pytest.fixture
+    def benchmark():
+        """Stand-in for pytest-benchmark's fixture when it is not installed: call once."""
+        def run(func, *args, **kwargs):
+            return func(*args, **kwargs)
+
+        return run
+
+
+@pytest.fixture(scope="session")
+def gpu_available():
+    """Whether a CUDA GPU is usable, probed once per test session."""
+    import sdfgen
+
+    return sdfgen.is_gpu_available()
+
+
+@pytest.fixture(scope="session")
+def cached_sdf():
+    """
+    Memoized sdfgen.generate_sdf for tests that only read the result.
+
+    Returns a function with the same signature as generate_sdf. Calls with the same mesh
+    arrays and keyword arguments share one read-only result; tests that modify the SDF
+    must call generate_sdf directly.
+    """
+    import sdfgen
+
+    cache = {}
+
+    def generate(vertices, triangles, **kwargs):
+        key = (id(vertices), id(triangles), tuple(sorted(kwargs.items())))
+        entry = cache.get(key)
+        if entry is None:
+            sdf = sdfgen.generate_sdf(vertices, triangles, **kwargs)
+            sdf.flags.writeable = False
+            # Holding the mesh arrays keeps their ids from being reused by other arrays
+            entry = cache[key] = (vertices, triangles, sdf)
+        return entry[2]
+
+    return generate